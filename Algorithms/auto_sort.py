@@ -0,0 +1,196 @@
+import argparse
+import json
+import random
+
+from benchmark import ALGORITHMS, run_benchmarks
+from sorting_algorithms import _uses_array_backend, sort_by_key
+
+# Adaptive Sorting
+# auto_sort samples the input, classifies it as one of the benchmark distributions and
+# sorts it with the algorithm that was fastest for that distribution and size.
+#
+# Usage (from the Algorithms directory):
+#   python auto_sort.py --sizes 16 64 1000 100000 --output table.json   # calibrate on this machine
+
+# Number of positions inspected when profiling the input
+SAMPLE_SIZE = 1024
+
+# Algorithms auto_sort may choose. bubble_sort is never chosen: on input the sample wrongly
+# took for sorted it would be quadratic, whereas insertion_sort degrades far more gently.
+CANDIDATES = [name for name in ALGORITHMS if name != "bubble_sort"]
+
+# Decision table: for each input class, a list of [max_size, algorithm] breakpoints. The first
+# breakpoint whose max_size is >= n is used; the last one also covers larger inputs.
+# Calibrated with calibrate() from a benchmark run (sizes 16-100000, CPython 3.11) after the
+# small-block cutoffs and galloping merge: `python auto_sort.py --sizes 16 64 1000 20000 100000`.
+DECISION_TABLE = {
+    "random": [[16, "insertion_sort"], [64, "introsort"], [100_000, "radix_sort"]],
+    "sorted": [[16, "insertion_sort"], [100_000, "natural_merge_sort"]],
+    "reverse": [[100_000, "natural_merge_sort"]],
+    "few_unique": [[16, "insertion_sort"], [64, "introsort"], [100_000, "quick_sort"]],
+    "nearly_sorted": [[64, "insertion_sort"], [100_000, "natural_merge_sort"]],
+    "organ_pipe": [[16, "insertion_sort"], [100_000, "natural_merge_sort"]],
+}
+
+# radix_sort is only used for keys spanning fewer bits than this; wider keys need so many
+# passes that a comparison sort is faster. FALLBACK is used instead, and for non-numeric data.
+RADIX_MAX_KEY_BITS = 32
+FALLBACK = "introsort"
+
+
+def profile_input(arr, sample_size=SAMPLE_SIZE, seed=0):
+    """
+    Cheaply measures the characteristics auto_sort decides on.
+    - Inspects sample_size random positions (all positions for small inputs).
+    - descent_ratio: fraction of sampled neighbours (arr[i], arr[i+1]) that are out of order.
+    - ascent_ratio: fraction that are strictly in order.
+    - turn_ratio: fraction of sampled triples whose middle element is a strict peak or valley -
+      low for input made of a few long ascending/descending runs.
+    - unique_ratio: distinct sampled values / sampled values - low when there are many duplicates.
+    - numeric / integer, and key_bits (bit length of the sampled key range) for integers.
+    Time Complexity: O(sample_size).
+    """
+    n = len(arr)
+    if n < 3:
+        positions = range(max(0, n - 1))
+    elif n - 2 <= sample_size:
+        positions = range(n - 2)
+    else:
+        positions = sorted(random.Random(seed).sample(range(n - 2), sample_size))
+    descents = ascents = turns = 0
+    for i in positions:
+        a, b = arr[i], arr[i + 1]
+        descents += b < a
+        ascents += a < b
+        if i + 2 < n:
+            c = arr[i + 2]
+            turns += (a < b and c < b) or (b < a and b < c)  # b is a peak or a valley
+    sample = [arr[i] for i in positions] or list(arr)
+    checked = max(1, len(positions))
+    integer = all(type(x) is int for x in sample)
+    numeric = integer or all(type(x) in (int, float) for x in sample)
+    return {
+        "size": n,
+        "integer": integer,
+        "numeric": numeric,
+        "key_bits": (max(sample) - min(sample)).bit_length() if integer and sample else None,
+        "descent_ratio": descents / checked,
+        "ascent_ratio": ascents / checked,
+        "turn_ratio": turns / checked,
+        "unique_ratio": len(set(sample)) / len(sample) if numeric and sample else 1.0,
+    }
+
+
+def classify(profile):
+    """Maps an input profile to the name of the benchmark distribution it most resembles."""
+    if profile["descent_ratio"] == 0:
+        return "sorted"
+    if profile["ascent_ratio"] == 0:
+        return "reverse"
+    if profile["descent_ratio"] < 0.05:
+        return "nearly_sorted"
+    if profile["turn_ratio"] < 0.05:
+        return "organ_pipe"
+    if profile["unique_ratio"] < 0.25:
+        return "few_unique"
+    return "random"
+
+
+def lookup(distribution, size, table=None):
+    """Returns the algorithm the decision table picks for this input class and size."""
+    breakpoints = (table or DECISION_TABLE)[distribution]
+    for max_size, algorithm in breakpoints:
+        if size <= max_size:
+            return algorithm
+    return breakpoints[-1][1]
+
+
+def choose_algorithm(arr, table=None):
+    """
+    Decides how auto_sort would sort arr without sorting it.
+    Returns the input profile extended with the "distribution" it was classified as and
+    the chosen "algorithm", so decisions can be inspected and logged.
+    """
+    if _uses_array_backend(arr):
+        # The NumPy backends are fastest through quick_sort for every distribution we benchmark
+        return {"size": len(arr), "distribution": None, "algorithm": "quick_sort"}
+    decision = profile_input(arr)
+    decision["distribution"] = classify(decision)
+    algorithm = lookup(decision["distribution"], len(arr), table)
+    if algorithm == "radix_sort":
+        # The sample may miss a non-integer element; check them all before committing to radix
+        if not decision["integer"] or decision["key_bits"] > RADIX_MAX_KEY_BITS or \
+                not all(type(x) is int for x in arr):
+            algorithm = FALLBACK
+    decision["algorithm"] = algorithm
+    return decision
+
+
+def auto_sort(arr, table=None, key=None, reverse=False):
+    """
+    Adaptive Sort:
+    - Profiles a sample of arr (size, key range, integer vs. general, presortedness and
+      duplicate ratio) and dispatches to the algorithm chosen by the decision table,
+      e.g. insertion sort for tiny inputs, natural merge sort for presorted runs and radix
+      sort for integers in a dense range.
+    - Sorts arr in place and returns it, like the other algorithms.
+    - key / reverse work as in sorted(); the decision is then made on the (key, position) pairs.
+    - Time Complexity: O(sample) for the decision plus that of the chosen algorithm.
+    """
+    if key is not None or reverse:
+        return sort_by_key(auto_sort, arr, key, reverse, table)
+    algorithm = choose_algorithm(arr, table)["algorithm"]
+    result = ALGORITHMS[algorithm](arr)
+    if result is not arr:
+        arr[:] = result  # quick_sort returns a new list
+    return arr
+
+
+def calibrate(results, candidates=None):
+    """
+    Builds a decision table from benchmark results (as returned by run_benchmarks).
+    - For every distribution and size the fastest candidate by median time wins.
+    - Neighbouring sizes with the same winner are collapsed into one breakpoint.
+    """
+    candidates = candidates or CANDIDATES
+    best = {}
+    for row in results:
+        if row["algorithm"] not in candidates or row.get("backend", "list") != "list":
+            continue
+        key = (row["distribution"], row["size"])
+        if key not in best or row["median"] < best[key]["median"]:
+            best[key] = row
+    table = {}
+    for (distribution, size), row in sorted(best.items()):
+        breakpoints = table.setdefault(distribution, [])
+        if breakpoints and breakpoints[-1][1] == row["algorithm"]:
+            breakpoints[-1][0] = size
+        else:
+            breakpoints.append([size, row["algorithm"]])
+    return table
+
+
+def load_decision_table(path):
+    """Replaces DECISION_TABLE with one saved by `python auto_sort.py --output`."""
+    with open(path) as f:
+        DECISION_TABLE.update(json.load(f))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calibrate the auto_sort decision table on this machine.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[16, 64, 1_000, 100_000])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", help="write the calibrated table to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(CANDIDATES, args.sizes, repeats=args.repeats, verbose=False)
+    table = calibrate(results)
+    for distribution, breakpoints in table.items():
+        print(f"{distribution:<14} {breakpoints}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(table, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
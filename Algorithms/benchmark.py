@@ -0,0 +1,441 @@
+import argparse
+import copy
+import csv
+import functools
+import gc
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+from array import array
+
+from instrumentation import OperationCounts, instrument
+from profiling import profile_case
+from sorting_algorithms import (SMALL_SORT_CUTOFFS, bubble_sort, insertion_sort, merge_sort, quick_sort, introsort,
+                                radix_sort, np)
+
+# Benchmark Suite for the Sorting Algorithms
+#
+# Usage (from the Algorithms directory):
+#   python benchmark.py --sizes 100 1000 10000 --repeats 7 --json results.json
+#   python benchmark.py --compare baseline.json --json results.json
+#   python benchmark.py --tune-cutoffs cutoffs.json
+#   python benchmark.py --sizes 10000 --profile profiles   # cProfile, flame graph stacks, peak memory
+
+# Algorithms under test, in the order they are reported
+ALGORITHMS = {
+    "bubble_sort": bubble_sort,
+    "insertion_sort": insertion_sort,
+    "merge_sort": merge_sort,
+    "natural_merge_sort": functools.partial(merge_sort, natural=True),
+    "quick_sort": quick_sort,
+    "introsort": introsort,
+    "radix_sort": radix_sort,
+}
+
+# Largest input each algorithm is run on; O(n^2) sorts would take hours past this
+MAX_SIZE = {
+    "bubble_sort": 10_000,
+    "insertion_sort": 10_000,
+}
+
+# Algorithms that never compare elements; their inputs are not wrapped when counting operations
+NON_COMPARISON = {"radix_sort"}
+
+# Input containers the algorithms can be benchmarked on: "numpy" (int64 ndarray) and "array"
+# (array('q')) select the NumPy array backends when NumPy is installed; without it "array"
+# runs the pure-Python code on the compact array
+BACKENDS = ["list", "numpy", "array"]
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+# Small-block cutoffs tried by tune_cutoffs, and the input size they are tuned on
+CUTOFF_CANDIDATES = [4, 8, 12, 16, 24, 32, 48, 64]
+TUNE_SIZE = 10_000
+
+# Upper bound for generated values (inclusive)
+MAX_VALUE = 1_000_000
+
+
+def random_values(n, rng):
+    """Uniformly random integers in [0, MAX_VALUE]."""
+    return [rng.randint(0, MAX_VALUE) for _ in range(n)]
+
+
+def sorted_values(n, rng):
+    """Already sorted input - the best case for adaptive algorithms."""
+    return sorted(random_values(n, rng))
+
+
+def reverse_sorted_values(n, rng):
+    """Input sorted in descending order."""
+    return sorted(random_values(n, rng), reverse=True)
+
+
+def few_unique_values(n, rng):
+    """Input drawn from only 10 distinct values (many duplicates)."""
+    choices = [rng.randint(0, MAX_VALUE) for _ in range(10)]
+    return [rng.choice(choices) for _ in range(n)]
+
+
+def nearly_sorted_values(n, rng):
+    """Sorted input with about 1% of the elements swapped to random positions."""
+    arr = sorted_values(n, rng)
+    for _ in range(max(1, n // 100)):
+        i = rng.randrange(n)
+        j = rng.randrange(n)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+def organ_pipe_values(n, rng):
+    """Ascending first half followed by a descending second half."""
+    arr = sorted(random_values(n, rng))
+    half = n // 2
+    return arr[:half] + arr[half:][::-1]
+
+
+# Input distributions, keyed by the name used on the command line and in reports
+DISTRIBUTIONS = {
+    "random": random_values,
+    "sorted": sorted_values,
+    "reverse": reverse_sorted_values,
+    "few_unique": few_unique_values,
+    "nearly_sorted": nearly_sorted_values,
+    "organ_pipe": organ_pipe_values,
+}
+
+
+# Vectorized versions of the distributions for the array backends. They take a
+# numpy.random.Generator and return int64 ndarrays without creating an int object per element.
+def random_ndarray(n, gen):
+    return gen.integers(0, MAX_VALUE, n, dtype=np.int64, endpoint=True)
+
+
+def sorted_ndarray(n, gen):
+    return np.sort(random_ndarray(n, gen))
+
+
+def reverse_sorted_ndarray(n, gen):
+    return sorted_ndarray(n, gen)[::-1].copy()
+
+
+def few_unique_ndarray(n, gen):
+    return gen.choice(random_ndarray(10, gen), n)
+
+
+def nearly_sorted_ndarray(n, gen):
+    arr = sorted_ndarray(n, gen)
+    pairs = min(max(1, n // 100), n // 2)
+    # Distinct positions, so the swaps cannot overlap and the result stays a permutation
+    i, j = gen.choice(n, 2 * pairs, replace=False).reshape(2, pairs)
+    arr[i], arr[j] = arr[j], arr[i].copy()
+    return arr
+
+
+def organ_pipe_ndarray(n, gen):
+    arr = sorted_ndarray(n, gen)
+    half = n // 2
+    return np.concatenate([arr[:half], arr[half:][::-1]])
+
+
+NDARRAY_DISTRIBUTIONS = {
+    "random": random_ndarray,
+    "sorted": sorted_ndarray,
+    "reverse": reverse_sorted_ndarray,
+    "few_unique": few_unique_ndarray,
+    "nearly_sorted": nearly_sorted_ndarray,
+    "organ_pipe": organ_pipe_ndarray,
+}
+
+
+def make_input(dist, size, seed=0, backend="list"):
+    """
+    Generates the input for one (distribution, size) case in the backend's container and
+    returns it with the expected sorted output.
+    - The list backend uses the pure-Python generators seeded with random.Random.
+    - The array backends generate with NumPy in bulk when it is installed (a different but
+      equally reproducible sequence) and are checked against np.sort.
+    """
+    if backend == "list" or np is None:
+        data = DISTRIBUTIONS[dist](size, random.Random(f"{seed}-{dist}-{size}"))
+        expected = sorted(data)
+        return (array("q", data) if backend == "array" else data), expected
+    gen = np.random.default_rng([seed, size, list(DISTRIBUTIONS).index(dist)])
+    data = NDARRAY_DISTRIBUTIONS[dist](size, gen)
+    expected = np.sort(data, kind="stable")
+    return (array("q", data.tobytes()) if backend == "array" else data), expected
+
+
+def _matches(result, expected):
+    """True if result holds the same values as expected (a list or an ndarray)."""
+    if isinstance(expected, list):
+        return list(result) == expected
+    return np.array_equal(np.asarray(result), expected)
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of a list of numbers.
+    - pct is given in the range 0-100.
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(timings):
+    """
+    Reduces a list of timings (seconds) to the statistics we report.
+    Median and p95 are used for comparisons because they are robust to outliers.
+    """
+    return {
+        "runs": len(timings),
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "p95": percentile(timings, 95),
+        "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+def time_run(func, data):
+    """
+    Times one call of func on a fresh copy of data (a list, ndarray or array.array).
+    - The copy is made outside the timed region.
+    - The garbage collector is disabled while timing so collections do not add noise.
+    """
+    arr = copy.copy(data)
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = func(arr)
+        elapsed = time.perf_counter() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return result, elapsed
+
+
+def benchmark_case(func, data, repeats=5, warmup=1):
+    """
+    Runs warmup calls (discarded) followed by repeated timed calls.
+    Returns the list of timings and the result of the last run.
+    """
+    for _ in range(warmup):
+        time_run(func, data)
+    timings = []
+    result = None
+    for _ in range(repeats):
+        result, elapsed = time_run(func, data)
+        timings.append(elapsed)
+    return timings, result
+
+
+def count_operations(name, data):
+    """
+    Runs algorithm `name` once with operation counting (see instrumentation.py).
+    Returns the result and a dictionary of counts. The run is separate from the timed runs,
+    which are never instrumented.
+    """
+    return instrument(ALGORITHMS[name], data, compare=name not in NON_COMPARISON)
+
+
+def run_benchmarks(algorithms=None, sizes=None, distributions=None, repeats=5, warmup=1, seed=0, verbose=True,
+                   backend="list", counts=False, profile_dir=None):
+    """
+    Runs every algorithm on every (size, distribution) combination.
+    - Each input is generated once per (size, distribution) from a fixed seed so runs are reproducible.
+    - Outputs are checked against sorted() so a fast but wrong result is never reported.
+    - backend="numpy" passes int64 ndarrays instead of lists (requires NumPy), backend="array"
+      passes array('q'); both are generated in bulk (see make_input).
+    - counts=True adds the operation counts of one extra instrumented run to each row
+      (list backend only - the array backends run in NumPy, out of reach of the counters).
+    - profile_dir profiles every case in extra untimed runs (see profiling.py), writing its
+      cProfile and collapsed-stack files there and adding peak_bytes and the hotspot to the row.
+    Returns a list of result dictionaries, one per combination.
+    """
+    algorithms = algorithms or list(ALGORITHMS)
+    sizes = sizes or DEFAULT_SIZES
+    distributions = distributions or list(DISTRIBUTIONS)
+    if backend == "numpy" and np is None:
+        raise RuntimeError("the numpy backend requires NumPy to be installed")
+    if counts and backend != "list":
+        raise ValueError("operation counts are only available for the list backend")
+    results = []
+    for size in sizes:
+        for dist in distributions:
+            data, expected = make_input(dist, size, seed, backend)
+            for name in algorithms:
+                if size > MAX_SIZE.get(name, float("inf")):
+                    continue  # Too slow at this size
+                timings, result = benchmark_case(ALGORITHMS[name], data, repeats, warmup)
+                if not _matches(result, expected):
+                    raise AssertionError(f"{name} produced unsorted output for {dist} n={size}")
+                row = {"algorithm": name, "backend": backend, "distribution": dist, "size": size}
+                row.update(summarize(timings))
+                if counts:
+                    result, ops = count_operations(name, data)
+                    if result != expected:
+                        raise AssertionError(f"{name} produced unsorted output for {dist} n={size} when counting")
+                    row.update(ops.as_dict())
+                if profile_dir:
+                    label = f"{name}-{backend}-{dist}-{size}"
+                    row.update(profile_case(ALGORITHMS[name], data, profile_dir, label))
+                results.append(row)
+                if verbose:
+                    print(f"{name:<18} {backend:<6} {dist:<14} n={size:<9} median={row['median']:.6f}s "
+                          f"p95={row['p95']:.6f}s stddev={row['stddev']:.6f}s")
+                    if counts:
+                        print(" " * 19 + " ".join(f"{field}={row[field]}" for field in OperationCounts.FIELDS))
+                    if profile_dir:
+                        print(" " * 19 + f"peak={row['peak_bytes']}B hotspot={row['hotspot']} "
+                              f"({row['hotspot_share']:.0%} of profiled time)")
+    return results
+
+
+def tune_cutoffs(candidates=None, size=TUNE_SIZE, distributions=None, repeats=5, warmup=1, seed=0, verbose=True):
+    """
+    Picks the small-block cutoff of each algorithm in SMALL_SORT_CUTOFFS for this machine.
+    - Times every candidate cutoff on each distribution at the given size (list backend).
+    - The candidate with the lowest sum of medians over the distributions wins.
+    Leaves SMALL_SORT_CUTOFFS set to the winners and returns them as a dictionary.
+    """
+    candidates = candidates or CUTOFF_CANDIDATES
+    distributions = distributions or list(DISTRIBUTIONS)
+    inputs = [make_input(dist, size, seed) for dist in distributions]
+    tuned = {}
+    for name in SMALL_SORT_CUTOFFS:
+        totals = {}
+        for cutoff in candidates:
+            SMALL_SORT_CUTOFFS[name] = cutoff
+            totals[cutoff] = 0.0
+            for data, expected in inputs:
+                timings, result = benchmark_case(ALGORITHMS[name], data, repeats, warmup)
+                if not _matches(result, expected):
+                    raise AssertionError(f"{name} produced unsorted output with cutoff {cutoff}")
+                totals[cutoff] += statistics.median(timings)
+            if verbose:
+                print(f"{name:<18} cutoff={cutoff:<4} n={size:<9} total median={totals[cutoff]:.6f}s")
+        SMALL_SORT_CUTOFFS[name] = tuned[name] = min(totals, key=totals.get)
+    return tuned
+
+
+def environment_info():
+    """Describes the machine and interpreter so reports from different hosts are not mixed up."""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def export_json(results, path):
+    """Writes results (plus environment information) to a JSON file."""
+    with open(path, "w") as f:
+        json.dump({"environment": environment_info(), "results": results}, f, indent=2)
+
+
+def export_csv(results, path):
+    """Writes results to a CSV file, one row per (algorithm, distribution, size)."""
+    fields = ["algorithm", "backend", "distribution", "size", "runs", "min", "median", "mean", "p95", "stddev"]
+    if results and "comparisons" in results[0]:
+        fields += OperationCounts.FIELDS
+    if results and "peak_bytes" in results[0]:
+        fields += ["peak_bytes", "hotspot", "hotspot_share"]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def load_json(path):
+    """Loads results previously written by export_json."""
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def _case_key(row):
+    """Identifies a benchmark case across result files."""
+    return row["algorithm"], row.get("backend", "list"), row["distribution"], row["size"]
+
+
+def compare_results(baseline, current, threshold=0.10):
+    """
+    Compares two result sets by median time.
+    - Returns a list of (key, baseline_median, current_median, ratio) for every case that
+      slowed down by more than threshold (0.10 = 10%).
+    """
+    base = {_case_key(r): r["median"] for r in baseline}
+    regressions = []
+    for r in current:
+        key = _case_key(r)
+        if key not in base or base[key] == 0:
+            continue
+        ratio = r["median"] / base[key]
+        if ratio > 1 + threshold:
+            regressions.append((key, base[key], r["median"], ratio))
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the sorting algorithms over sizes and input distributions.")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--distributions", nargs="+", choices=list(DISTRIBUTIONS), default=list(DISTRIBUTIONS))
+    parser.add_argument("--backend", choices=BACKENDS, default="list",
+                        help="container passed to the algorithms (numpy and array use the array backends)")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per case")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per case")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--counts", action="store_true",
+                        help="also count comparisons, swaps, writes, allocations and recursion depth (one extra run)")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="also profile each case (cProfile .prof, flame graph .folded and peak memory) into DIR")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown of the median reported as a regression")
+    parser.add_argument("--tune-cutoffs", metavar="FILE",
+                        help="instead of the suite, tune the small-block cutoffs of merge_sort, quick_sort and "
+                             "introsort on this machine and write them to FILE (see sorting_algorithms.load_cutoffs)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Runs the benchmark suite from the command line.
+    Exits with status 1 if --compare finds a regression, so it can gate CI.
+    """
+    args = parse_args(argv)
+    if args.tune_cutoffs:
+        tuned = tune_cutoffs(distributions=args.distributions, repeats=args.repeats, warmup=args.warmup,
+                             seed=args.seed)
+        print(" ".join(f"{name}={cutoff}" for name, cutoff in tuned.items()))
+        with open(args.tune_cutoffs, "w") as f:
+            json.dump(tuned, f, indent=2)
+        return 0
+    results = run_benchmarks(args.algorithms, args.sizes, args.distributions,
+                             args.repeats, args.warmup, args.seed, backend=args.backend, counts=args.counts,
+                             profile_dir=args.profile)
+    if args.json:
+        export_json(results, args.json)
+    if args.csv:
+        export_csv(results, args.csv)
+    if args.compare:
+        regressions = compare_results(load_json(args.compare), results, args.threshold)
+        for (name, backend, dist, size), old, new, ratio in regressions:
+            print(f"REGRESSION {name} [{backend}] {dist} n={size}: {old:.6f}s -> {new:.6f}s ({ratio:.2f}x)")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
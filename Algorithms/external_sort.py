@@ -0,0 +1,263 @@
+import argparse
+import heapq
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+
+from sorting_algorithms import merge_sort, radix_sort
+
+# External (Out-of-Core) Merge Sort
+# Sorts integer files larger than memory: the input is read in chunks that fit the memory
+# budget, each chunk is sorted and spilled to a temporary run file, and the runs are then
+# combined with a heap-based k-way merge that reads them through mmap.
+#
+# Usage (from the Algorithms directory):
+#   python external_sort.py numbers.txt sorted.txt --memory 256M
+#   python external_sort.py numbers.bin sorted.bin --format binary --algorithm radix_sort
+
+# Algorithms used to sort each in-memory chunk
+RUN_SORTERS = {
+    "merge_sort": merge_sort,
+    "radix_sort": radix_sort,
+}
+
+# Binary files hold native-endian signed 64-bit integers
+TYPECODE = "q"
+ITEM_SIZE = array(TYPECODE).itemsize
+
+# Approximate peak memory per element while a chunk is read and sorted: the list slot and
+# int object, the decoded input and the sort's own buffers (radix_sort also holds the keys,
+# their digits and two output lists). Measured with tracemalloc on full-range int64 values
+# (about 68 and 137 bytes) and rounded up.
+BYTES_PER_ELEMENT = {
+    "merge_sort": 80,
+    "radix_sort": 160,
+}
+
+# Largest block text input is read in (at most a quarter of the budget is spent on it). A block
+# is held together with its split tokens, which take up to TEXT_BLOCK_OVERHEAD times its size
+# when the numbers are short.
+TEXT_BLOCK_BYTES = 64 * 1024
+TEXT_BLOCK_OVERHEAD = 24
+
+# Maximum number of runs merged at once; more runs are merged in several passes
+MAX_FAN_IN = 64
+
+# Largest block read from each run and written to the output during the merge
+IO_BLOCK_ELEMENTS = 64 * 1024
+
+# Memory per buffered element during the merge: a run's decoded block (plus the mmap slice it
+# is decoded from), and the output block as int objects and, for text, their digits
+RUN_BUFFER_BYTES_PER_ELEMENT = 16
+OUTPUT_BUFFER_BYTES_PER_ELEMENT = 160
+
+
+def parse_size(text):
+    """Parses a memory size such as '512K', '64M' or '2G' into bytes."""
+    text = text.strip().upper().rstrip("B")
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def text_block_bytes(memory_budget):
+    """Returns the size of the blocks text input is read in under memory_budget bytes."""
+    return max(1, min(TEXT_BLOCK_BYTES, memory_budget // (4 * TEXT_BLOCK_OVERHEAD)))
+
+
+def chunk_elements(memory_budget, fmt="text", algorithm="merge_sort"):
+    """Returns how many integers a chunk may hold so reading and sorting it fits in memory_budget bytes."""
+    buffers = text_block_bytes(memory_budget) * TEXT_BLOCK_OVERHEAD if fmt == "text" else 0
+    return max(1, (memory_budget - buffers) // BYTES_PER_ELEMENT[algorithm])
+
+
+def io_block_elements(memory_budget):
+    """Returns the merge block size at which MAX_FAN_IN run blocks and the output block fit in memory_budget bytes."""
+    per_element = MAX_FAN_IN * RUN_BUFFER_BYTES_PER_ELEMENT + OUTPUT_BUFFER_BYTES_PER_ELEMENT
+    return max(1, min(IO_BLOCK_ELEMENTS, memory_budget // per_element))
+
+
+def read_binary_chunks(path, chunk_elements):
+    """Yields lists of at most chunk_elements integers from a binary int64 file."""
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(chunk_elements * ITEM_SIZE)
+            if not data:
+                return
+            if len(data) % ITEM_SIZE:
+                raise ValueError(f"{path} is not a whole number of {ITEM_SIZE}-byte integers")
+            yield array(TYPECODE, data).tolist()
+
+
+def read_text_chunks(path, chunk_elements, block_bytes=TEXT_BLOCK_BYTES):
+    """
+    Yields lists of at most chunk_elements integers from a whitespace-separated text file.
+    - The file is read in fixed-size blocks; a number split across two blocks is carried over.
+    """
+    chunk = []
+    carry = b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(block_bytes)
+            if not block:
+                break
+            tokens = (carry + block).split()
+            # The last token may continue in the next block unless the block ended in whitespace
+            carry = tokens.pop() if tokens and not block[-1:].isspace() else b""
+            for token in tokens:
+                chunk.append(int(token))
+                if len(chunk) == chunk_elements:
+                    yield chunk
+                    chunk = []
+    if carry:
+        chunk.append(int(carry))
+    if chunk:
+        yield chunk
+
+
+def read_chunks(path, fmt, chunk_elements, block_bytes=TEXT_BLOCK_BYTES):
+    """
+    Yields the integers of path in lists of at most chunk_elements, for fmt 'text' or 'binary'.
+    Text is read in blocks of block_bytes.
+    """
+    if fmt == "binary":
+        return read_binary_chunks(path, chunk_elements)
+    return read_text_chunks(path, chunk_elements, block_bytes)
+
+
+def write_run(values, directory):
+    """Writes a sorted list of integers to a new binary run file and returns its path."""
+    fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        array(TYPECODE, values).tofile(f)
+    return path
+
+
+def iter_run(path, block_elements=IO_BLOCK_ELEMENTS):
+    """
+    Yields the integers of a binary run file, memory-mapping it and decoding one block of
+    block_elements at a time.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            step = block_elements * ITEM_SIZE
+            for offset in range(0, len(mm), step):
+                yield from array(TYPECODE, mm[offset:offset + step])
+
+
+class _OutputWriter:
+    """Buffers merged integers and writes them in blocks as binary int64 or one number per line."""
+
+    def __init__(self, f, fmt, block_elements=IO_BLOCK_ELEMENTS):
+        self.f = f
+        self.fmt = fmt
+        self.block_elements = block_elements
+        self.block = []
+
+    def write(self, value):
+        self.block.append(value)
+        if len(self.block) >= self.block_elements:
+            self.flush()
+
+    def flush(self):
+        if not self.block:
+            return
+        if self.fmt == "binary":
+            array(TYPECODE, self.block).tofile(self.f)
+        else:
+            self.f.write("\n".join(map(str, self.block)).encode() + b"\n")
+        self.block = []
+
+
+def merge_runs(run_paths, output, fmt="binary", block_elements=IO_BLOCK_ELEMENTS):
+    """
+    K-way merges sorted run files into `output` (a file opened in binary mode) using a heap.
+    Runs are read and the output is written in blocks of block_elements.
+    Returns the number of integers written.
+    """
+    writer = _OutputWriter(output, fmt, block_elements)
+    count = 0
+    for value in heapq.merge(*(iter_run(path, block_elements) for path in run_paths)):
+        writer.write(value)
+        count += 1
+    writer.flush()
+    return count
+
+
+def reduce_runs(run_paths, directory, block_elements=IO_BLOCK_ELEMENTS):
+    """
+    Runs merge passes of at most MAX_FAN_IN runs each, replacing the merged run files with
+    new ones in directory, until few enough runs remain for a single final merge.
+    Returns the remaining run paths.
+    """
+    runs = list(run_paths)
+    while len(runs) > MAX_FAN_IN:
+        merged = []
+        for k in range(0, len(runs), MAX_FAN_IN):
+            group = runs[k:k + MAX_FAN_IN]
+            fd, path = tempfile.mkstemp(suffix=".run", dir=directory)
+            with os.fdopen(fd, "wb") as f:
+                merge_runs(group, f, block_elements=block_elements)
+            for run in group:
+                os.remove(run)
+            merged.append(path)
+        runs = merged
+    return runs
+
+
+def external_sort(input_path, output_path, memory_budget=64 << 20, fmt="text", output_fmt=None,
+                  algorithm="merge_sort", tmpdir=None):
+    """
+    External Merge Sort:
+    - Reads input_path in chunks sized so a chunk, its sort buffers and the read buffer fit
+      in memory_budget bytes (see BYTES_PER_ELEMENT).
+    - Sorts each chunk with `algorithm` and spills it to a temporary run file.
+    - Merges at most MAX_FAN_IN runs at a time with a heap, reading the runs through mmap,
+      until a single merge writes output_path. The merge blocks are sized to fit the budget too.
+    - fmt / output_fmt are 'text' (whitespace-separated) or 'binary' (native int64).
+    - Time Complexity: O(n log n) comparisons; O(n * passes) I/O.
+    - Space Complexity: O(memory_budget) in memory, O(n) on disk for the runs.
+    Returns the number of integers sorted.
+    """
+    output_fmt = output_fmt or fmt
+    sort_run = RUN_SORTERS[algorithm]
+    block_elements = io_block_elements(memory_budget)
+    with tempfile.TemporaryDirectory(dir=tmpdir, prefix="external_sort_") as workdir:
+        runs = []
+        chunks = read_chunks(input_path, fmt, chunk_elements(memory_budget, fmt, algorithm),
+                             text_block_bytes(memory_budget))
+        for chunk in chunks:
+            runs.append(write_run(sort_run(chunk), workdir))
+            del chunk  # Drop the chunk before reading the next one to stay within budget
+
+        runs = reduce_runs(runs, workdir, block_elements)
+        with open(output_path, "wb") as out:
+            return merge_runs(runs, out, output_fmt, block_elements)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sort an integer file larger than memory.")
+    parser.add_argument("input", help="file of integers to sort")
+    parser.add_argument("output", help="where to write the sorted integers")
+    parser.add_argument("--format", choices=["text", "binary"], default="text",
+                        help="input format: whitespace-separated text or native int64 binary")
+    parser.add_argument("--output-format", choices=["text", "binary"],
+                        help="output format (defaults to the input format)")
+    parser.add_argument("--memory", default="64M", help="memory budget, e.g. 512K, 64M, 2G")
+    parser.add_argument("--algorithm", choices=list(RUN_SORTERS), default="merge_sort",
+                        help="algorithm used to sort each in-memory run")
+    parser.add_argument("--tmpdir", help="directory for the temporary run files")
+    args = parser.parse_args(argv)
+
+    count = external_sort(args.input, args.output, parse_size(args.memory), args.format,
+                          args.output_format, args.algorithm, args.tmpdir)
+    print(f"Sorted {count} integers into {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+import sys
+import tracemalloc
+
+# Operation-Count Instrumentation
+# Counts what the sorting algorithms do instead of how long they take, so the empirical counts
+# can be checked against the complexity claims in their docstrings.
+#
+# The algorithms contain no counting code: the input is wrapped in CountingKey elements and a
+# CountingList container that count operations as they happen, so uninstrumented calls run
+# the normal code on normal lists and pay nothing. The only requirement on the algorithms is
+# that auxiliary buffers are copied from the input (arr[:]) rather than built as new lists,
+# so that writes into them are seen.
+#
+# Usage (from the Algorithms directory):
+#   python benchmark.py --sizes 1000 10000 --counts --csv results.csv
+
+
+class OperationCounts:
+    """Totals collected during one instrumented run."""
+
+    FIELDS = ["comparisons", "swaps", "writes", "allocated_bytes", "max_depth"]
+
+    def __init__(self):
+        self.comparisons = 0  # Element-to-element comparisons
+        self.swaps = 0  # Pairs of writes that exchanged two elements (each swap is also two writes)
+        self.writes = 0  # Element stores into the array or a buffer derived from it
+        self.allocated_bytes = 0  # Peak memory allocated during the run
+        self.max_depth = 0  # Deepest nesting of calls below the algorithm (0 = it called nothing)
+        self._last_write = None  # (list, index, old value, new value) of the previous write
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+
+class PeakMemory:
+    """
+    Context manager that measures the peak bytes allocated inside its block with tracemalloc,
+    available as .peak_bytes after the block. Tracing is started and stopped around the
+    block unless it was already on.
+    """
+
+    def __enter__(self):
+        self.peak_bytes = 0
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.peak_bytes = max(0, tracemalloc.get_traced_memory()[1] - self._baseline)
+        if self._started_tracing:
+            tracemalloc.stop()
+        return False
+
+
+class CountingKey:
+    """Wraps an element and counts every comparison made with it."""
+
+    __slots__ = ("value", "counts")
+
+    def __init__(self, value, counts):
+        self.value = value
+        self.counts = counts
+
+    def __lt__(self, other):
+        self.counts.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.counts.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.counts.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.counts.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        self.counts.comparisons += 1
+        return self.value == other.value
+
+    def __ne__(self, other):
+        self.counts.comparisons += 1
+        return self.value != other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class CountingList(list):
+    """
+    A list that counts element writes and swaps.
+    - Slices are CountingLists sharing the same counts, so buffers an algorithm copies from
+      its input (e.g. arr[:]) are counted too.
+    - A swap is recognised as two consecutive writes that exchange the values at two positions,
+      as produced by `a[i], a[j] = a[j], a[i]`.
+    """
+
+    def __init__(self, iterable=(), counts=None):
+        super().__init__(iterable)
+        self.counts = counts if counts is not None else OperationCounts()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CountingList(list.__getitem__(self, index), self.counts)
+        return list.__getitem__(self, index)
+
+    def __setitem__(self, index, value):
+        counts = self.counts
+        if isinstance(index, slice):
+            value = list(value)
+            counts.writes += len(value)
+            counts._last_write = None
+            list.__setitem__(self, index, value)
+            return
+        old = list.__getitem__(self, index)
+        counts.writes += 1
+        last = counts._last_write
+        if last is not None and last[0] is self and last[1] != index and last[2] is value and last[3] is old:
+            counts.swaps += 1
+            counts._last_write = None
+        else:
+            counts._last_write = (self, index, old, value)
+        list.__setitem__(self, index, value)
+
+
+def _depth_profiler(counts):
+    """Returns a sys.setprofile hook that records the deepest nesting of algorithm frames."""
+    own_file = __file__
+    depth = 0
+
+    def profile(frame, event, arg):
+        nonlocal depth
+        if frame.f_code.co_filename == own_file:
+            return  # CountingKey / CountingList methods are not part of the algorithm
+        if event == "call":
+            depth += 1
+            if depth > counts.max_depth:
+                counts.max_depth = depth
+        elif event == "return":
+            depth -= 1
+
+    return profile
+
+
+def instrument(func, arr, *args, compare=True):
+    """
+    Runs func(arr_copy, *args) with instrumentation and returns (result, OperationCounts).
+    - compare=True wraps every element in a CountingKey to count comparisons. Pass False for
+      algorithms that do arithmetic on the keys instead of comparing them (radix_sort).
+    - Writes and swaps are counted on the input container and the slices taken from it.
+      Algorithms that build new lists instead (quick_sort's comprehensions) show up in
+      allocated_bytes rather than writes.
+    - Allocations are the peak bytes traced by tracemalloc during the call.
+    - max_depth counts nested Python calls below func, so recursion shows as depth > 1.
+    The result is returned with the wrappers removed.
+    """
+    counts = OperationCounts()
+    data = CountingList((CountingKey(x, counts) for x in arr) if compare else arr, counts)
+    with PeakMemory() as memory:
+        previous_profiler = sys.getprofile()
+        sys.setprofile(_depth_profiler(counts))
+        try:
+            result = func(data, *args)
+        finally:
+            sys.setprofile(previous_profiler)
+    counts.allocated_bytes = memory.peak_bytes
+    counts.max_depth = max(0, counts.max_depth - 1)  # The profiler also sees the call to func
+    if compare:
+        result = [x.value if isinstance(x, CountingKey) else x for x in result]
+    else:
+        result = list(result)
+    return result, counts
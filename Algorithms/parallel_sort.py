@@ -0,0 +1,166 @@
+import argparse
+import heapq
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from sorting_algorithms import _write_back, bubble_sort, merge_sort, quick_sort, introsort, radix_sort
+
+# Parallel Sorting Engine
+# Sorts large arrays with several processes so the work is not limited by the GIL.
+#
+# Usage (from the Algorithms directory):
+#   python parallel_sort.py --size 1000000 --algorithm merge_sort --workers 1 2 4 8
+
+# Algorithms a chunk can be sorted with. Workers receive the name, not the function.
+SORTERS = {
+    "bubble_sort": bubble_sort,
+    "merge_sort": merge_sort,
+    "quick_sort": quick_sort,
+    "introsort": introsort,
+    "radix_sort": radix_sort,
+}
+
+# Below this size the process start-up cost outweighs any speedup, so we sort serially
+MIN_PARALLEL_SIZE = 10_000
+
+# Numeric element formats a typed array (array.array, memoryview, numpy.ndarray) can be shared with
+TYPED_FORMATS = "bBhHiIlLqQfd"
+
+
+def _typecode(arr):
+    """
+    Returns the array typecode used to place arr in shared memory.
+    - Typed arrays keep their own element format (array.array typecode, memoryview format
+      or ndarray dtype), if it is one of TYPED_FORMATS.
+    - Lists become 64-bit ints or doubles. Mixed int/float input is rejected: storing it as
+      doubles would turn its ints into floats.
+    """
+    dtype = getattr(arr, "dtype", None)
+    typecode = getattr(arr, "typecode", None) or getattr(arr, "format", None) or getattr(dtype, "char", None)
+    if typecode is not None:
+        if typecode not in TYPED_FORMATS:
+            raise TypeError(f"parallel_sort does not support arrays of type {typecode!r}")
+        return typecode
+    if all(type(x) is int for x in arr):
+        return "q"
+    if all(type(x) is float for x in arr):
+        return "d"
+    raise TypeError("parallel_sort supports lists of only ints or only floats")
+
+
+def _shared_copy(arr, typecode):
+    """Returns arr as an array of the given typecode, ready to be copied into shared memory."""
+    try:
+        return array(typecode, arr)
+    except OverflowError:
+        raise TypeError("parallel_sort supports only ints in the signed 64-bit range") from None
+
+
+def _sort_chunk(shm_name, typecode, lo, hi, algorithm):
+    """
+    Worker: sorts the slice [lo, hi) of the shared buffer in place.
+    Only the buffer name and the bounds are pickled; the data itself never is.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf.cast(typecode)  # Covers the whole block, which may be rounded up to a page
+        try:
+            chunk = view[lo:hi].tolist()
+            result = SORTERS[algorithm](chunk)  # quick_sort returns a new list, the others sort in place
+            view[lo:hi] = array(typecode, result)
+        finally:
+            view.release()  # close() raises BufferError while a view is still exported
+    finally:
+        shm.close()
+
+
+def chunk_bounds(n, chunks):
+    """Splits range(n) into the given number of contiguous, nearly equal [lo, hi) ranges."""
+    return [(n * k // chunks, n * (k + 1) // chunks) for k in range(chunks)]
+
+
+def parallel_sort(arr, algorithm="merge_sort", workers=None):
+    """
+    Parallel Sort:
+    - Copies arr into a shared memory block, splits it into one chunk per worker and sorts
+      the chunks concurrently in a process pool with the chosen algorithm.
+    - The sorted chunks are then combined with a heap-based k-way merge.
+    - Inputs smaller than MIN_PARALLEL_SIZE, or workers=1, are sorted serially.
+    - arr may be a list, array.array, memoryview or numpy.ndarray and keeps its type.
+    - Parallel list input must be all ints or all floats, and its ints must fit in 64 bits;
+      typed arrays must have one of TYPED_FORMATS (TypeError otherwise).
+    - Time Complexity: O((n/p) log(n/p)) per worker for p workers, plus O(n log p) for the merge.
+    - Space Complexity: O(n) for the shared block and the merged output.
+    """
+    if algorithm not in SORTERS:
+        raise ValueError(f"unknown algorithm {algorithm!r}; choose from {', '.join(SORTERS)}")
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    if workers == 1 or n < MIN_PARALLEL_SIZE:
+        _write_back(arr, SORTERS[algorithm](list(arr)))
+        return arr
+
+    typecode = _typecode(arr)
+    data = _shared_copy(arr, typecode)
+    bounds = chunk_bounds(n, workers)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(data) * data.itemsize))
+    try:
+        # The block may be larger than requested (rounded up to the page size), so use only n items
+        view = shm.buf.cast(typecode)[:n]
+        try:
+            view[:] = data
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_sort_chunk, shm.name, typecode, lo, hi, algorithm) for lo, hi in bounds]
+                for future in futures:
+                    future.result()  # Re-raises any error from a worker
+            runs = [view[lo:hi].tolist() for lo, hi in bounds]
+        finally:
+            view.release()  # close() raises BufferError while a view is still exported
+    finally:
+        try:
+            shm.close()
+        finally:
+            shm.unlink()
+    _write_back(arr, list(heapq.merge(*runs)))
+    return arr
+
+
+def speedup_curve(arr, algorithm="merge_sort", worker_counts=(1, 2, 4, 8), repeats=3):
+    """
+    Measures parallel_sort on copies of arr for each worker count.
+    - Each entry reports the best of `repeats` runs and the speedup relative to the first count.
+    Returns a list of {"workers", "seconds", "speedup"} dictionaries.
+    """
+    curve = []
+    for workers in worker_counts:
+        best = float("inf")
+        for _ in range(repeats):
+            data = list(arr)
+            start = time.perf_counter()
+            parallel_sort(data, algorithm, workers)
+            best = min(best, time.perf_counter() - start)
+        curve.append({"workers": workers, "seconds": best, "speedup": curve[0]["seconds"] / best if curve else 1.0})
+    return curve
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the speedup of parallel_sort against worker count.")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--algorithm", choices=list(SORTERS), default="merge_sort")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    arr = [rng.randint(0, 1_000_000) for _ in range(args.size)]
+    for point in speedup_curve(arr, args.algorithm, args.workers, args.repeats):
+        print(f"workers={point['workers']:<3} time={point['seconds']:.4f}s speedup={point['speedup']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import copy
+import cProfile
+import os
+import sys
+import time
+from collections import Counter
+
+from instrumentation import PeakMemory
+
+# Profiling Hooks for the Benchmark Runner
+# Shows where an algorithm spends its time and memory, not just how long it takes in total.
+# Each profiled case gets three extra untimed runs, because the profilers would distort
+# each other (cProfile and the stack profiler share the interpreter's profiling hook, and
+# tracemalloc slows down every allocation):
+# - cProfile statistics, saved as a .prof file (python -m pstats, snakeviz, ...).
+# - Collapsed stacks, saved as a .folded file: one "outer;inner;innermost microseconds" line
+#   per call stack with the self time spent there, the input format of flamegraph.pl,
+#   speedscope and inferno.
+# - Peak memory allocated during the call, from tracemalloc.
+#
+# Usage (from the Algorithms directory):
+#   python benchmark.py --sizes 10000 --algorithms merge_sort quick_sort --profile profiles
+#   flamegraph.pl profiles/merge_sort-list-random-10000.folded > merge_sort.svg
+
+
+def _frame_name(code):
+    """Names a Python function in a stack line (semicolons would split the stack)."""
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+
+
+def _builtin_name(func):
+    """Names a builtin (C) function in a stack line, e.g. list.append."""
+    owner = getattr(func, "__self__", None)
+    name = getattr(func, "__qualname__", None) or getattr(func, "__name__", repr(func))
+    if owner is not None and not isinstance(owner, type(sys)) and "." not in name:
+        name = f"{type(owner).__name__}.{name}"
+    return name.replace(";", ",")
+
+
+def _stack_profiler(stacks, clock=time.perf_counter):
+    """
+    Returns a sys.setprofile hook that adds the self time (in seconds) of every call to
+    stacks[(outer, ..., innermost)]. Builtin functions are included, so time spent in e.g.
+    sorted() or list.extend shows up as their own frames.
+    """
+    stack = []  # [name, start time, time spent in children] per active call
+
+    def profile(frame, event, arg):
+        now = clock()
+        if event == "call" or event == "c_call":
+            stack.append([_frame_name(frame.f_code) if event == "call" else _builtin_name(arg), now, 0.0])
+        elif stack:  # return, c_return, c_exception; the first is from the call that installed us
+            elapsed = now - stack[-1][1]
+            key = tuple(entry[0] for entry in stack)
+            stacks[key] += elapsed - stack[-1][2]
+            stack.pop()
+            if stack:
+                stack[-1][2] += elapsed
+
+    return profile
+
+
+def folded_stacks(func, data, *args):
+    """
+    Runs func(copy of data, *args) under the stack profiler.
+    Returns the result and a Counter mapping each call stack (a tuple of frame names,
+    outermost first) to its self time in seconds. Times include the profiler's overhead,
+    so compare them with each other rather than with the timed runs.
+    """
+    arr = copy.copy(data)
+    stacks = Counter()
+    previous_profiler = sys.getprofile()
+    sys.setprofile(_stack_profiler(stacks))
+    try:
+        result = func(arr, *args)
+    finally:
+        sys.setprofile(previous_profiler)  # Its call is pushed but never popped, so it is never recorded
+    return result, stacks
+
+
+def write_folded(stacks, path):
+    """Writes stacks in the collapsed format ("a;b;c 123", self time in whole microseconds)."""
+    with open(path, "w") as f:
+        for stack, seconds in sorted(stacks.items()):
+            microseconds = round(seconds * 1_000_000)
+            if microseconds > 0:
+                f.write(f"{';'.join(stack)} {microseconds}\n")
+
+
+def peak_memory(func, data, *args):
+    """Runs func(copy of data, *args) and returns the result and the peak bytes allocated by the call."""
+    arr = copy.copy(data)
+    with PeakMemory() as memory:
+        result = func(arr, *args)
+    return result, memory.peak_bytes
+
+
+def profile_case(func, data, directory, label):
+    """
+    Profiles one benchmark case and writes <label>.prof and <label>.folded to directory.
+    Returns {"peak_bytes", "hotspot", "hotspot_share"}: the peak memory of the call and the
+    function with the most self time over all its stacks, with its share of the total.
+    """
+    os.makedirs(directory, exist_ok=True)
+    profiler = cProfile.Profile()
+    profiler.runcall(func, copy.copy(data))
+    profiler.dump_stats(os.path.join(directory, f"{label}.prof"))
+    _, stacks = folded_stacks(func, data)
+    write_folded(stacks, os.path.join(directory, f"{label}.folded"))
+    _, peak = peak_memory(func, data)
+    self_times = Counter()
+    for stack, seconds in stacks.items():
+        self_times[stack[-1]] += seconds
+    total = sum(self_times.values())
+    hottest = max(self_times, key=self_times.get, default="")
+    return {
+        "peak_bytes": peak,
+        "hotspot": hottest,
+        "hotspot_share": self_times[hottest] / total if total else 0.0,
+    }
@@ -0,0 +1,153 @@
+from bisect import bisect_left
+
+# Search Algorithms
+# Alternatives to linear_search for data that is searched many times.
+
+
+def binary_search(arr, target):
+    """
+    Binary Search Algorithm:
+    - Repeatedly halves the search range of a sorted array.
+    - Returns the index of the first element equal to target, or -1 if it is not present.
+    - Time Complexity: O(log n).
+    - Space Complexity: O(1).
+    """
+    i = bisect_left(arr, target)
+    if i < len(arr) and arr[i] == target:
+        return i
+    return -1
+
+
+def interpolation_search(arr, target):
+    """
+    Interpolation Search Algorithm:
+    - For sorted numeric arrays: guesses the position of target from its value relative to
+      the ends of the current range, instead of always probing the middle.
+    - Returns the index of the first element equal to target, or -1 if it is not present.
+    - Time Complexity: O(log log n) for uniformly distributed values, O(n) in the worst case.
+    - Space Complexity: O(1).
+    """
+    lo, hi = 0, len(arr) - 1
+    while lo <= hi and arr[lo] <= target <= arr[hi]:
+        if arr[hi] == arr[lo]:
+            pos = lo
+        else:
+            pos = lo + int((target - arr[lo]) * (hi - lo) / (arr[hi] - arr[lo]))
+        if arr[pos] < target:
+            lo = pos + 1
+        elif arr[pos] > target:
+            hi = pos - 1
+        else:
+            # Step back over duplicates so the first occurrence is returned
+            return bisect_left(arr, target, lo, pos + 1)
+    return -1
+
+
+def exponential_search(arr, target):
+    """
+    Exponential Search Algorithm:
+    - For sorted arrays: doubles a bound until it passes target, then binary searches
+      the last range. Fast when the target is near the front.
+    - Returns the index of the first element equal to target, or -1 if it is not present.
+    - Time Complexity: O(log i), where i is the position of target.
+    - Space Complexity: O(1).
+    """
+    n = len(arr)
+    bound = 1
+    while bound < n and arr[bound] < target:
+        bound *= 2
+    i = bisect_left(arr, target, bound // 2, min(bound + 1, n))
+    if i < n and arr[i] == target:
+        return i
+    return -1
+
+
+def build_index(arr):
+    """
+    Builds a hash index mapping each value of arr to the sorted list of its positions.
+    - Time Complexity: O(n) to build, O(1) per lookup afterwards.
+    - Space Complexity: O(n).
+    """
+    index = {}
+    for i, value in enumerate(arr):
+        positions = index.get(value)
+        if positions is None:
+            index[value] = [i]
+        else:
+            positions.append(i)
+    return index
+
+
+def _mutator(name):
+    """Wraps the list method `name` so that calling it drops the cached index."""
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._index = None
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class IndexedList(list):
+    """
+    A list with a cached value -> positions hash index for repeated lookups.
+    - The index is built on the first lookup and reused until the list is modified.
+    - Every mutating list operation invalidates the index, so lookups are never stale.
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._index = None
+
+    __setitem__ = _mutator("__setitem__")
+    __delitem__ = _mutator("__delitem__")
+    __iadd__ = _mutator("__iadd__")
+    __imul__ = _mutator("__imul__")
+    append = _mutator("append")
+    extend = _mutator("extend")
+    insert = _mutator("insert")
+    pop = _mutator("pop")
+    remove = _mutator("remove")
+    clear = _mutator("clear")
+    sort = _mutator("sort")
+    reverse = _mutator("reverse")
+
+    def index_map(self):
+        """Returns the value -> positions index, building it if the list changed since the last lookup."""
+        if self._index is None:
+            self._index = build_index(self)
+        return self._index
+
+    def positions(self, target):
+        """Returns every index holding target (empty list if none). O(1) once the index is built."""
+        return list(self.index_map().get(target, ()))
+
+    def find(self, target):
+        """Returns the first index holding target, or -1. Same result as linear_search."""
+        positions = self.index_map().get(target)
+        return positions[0] if positions else -1
+
+
+def search_many(arr, targets):
+    """
+    Batched search: returns, for each target, the index of its first occurrence in arr (or -1).
+    - An IndexedList answers from its cached index.
+    - Otherwise arr is scanned once, stopping early when every target has been found.
+    - Time Complexity: O(n + m) for n elements and m targets, instead of O(n * m) for
+      m separate linear searches.
+    - Space Complexity: O(m).
+    """
+    if isinstance(arr, IndexedList):
+        index = arr.index_map()
+        return [index[t][0] if t in index else -1 for t in targets]
+    wanted = set(targets)
+    found = {}
+    for i, value in enumerate(arr):
+        if value in wanted and value not in found:
+            found[value] = i
+            if len(found) == len(wanted):
+                break
+    return [found.get(t, -1) for t in targets]
@@ -1,16 +1,37 @@
+import json
 import time
 import random
+import warnings
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it every input uses the pure-Python code
+    np = None
 
 # Sorting Algorithms and Linear Search
 
-def bubble_sort(arr):
+# Ranges of at most this many elements are sorted with insertion sort instead of being split
+# further: below the cutoff the per-call and per-pass overhead of the divide-and-conquer
+# algorithms costs more than insertion sort's extra comparisons. Tuned per machine with
+# `python benchmark.py --tune-cutoffs cutoffs.json` and loaded with load_cutoffs.
+SMALL_SORT_CUTOFFS = {"merge_sort": 16, "quick_sort": 16, "introsort": 16}
+
+# Consecutive wins of one run after which _merge switches to galloping
+MIN_GALLOP = 7
+
+def bubble_sort(arr, key=None, reverse=False):
     """
     Bubble Sort Algorithm:
     - Compares adjacent elements and swaps them if they are in the wrong order.
     - Repeatedly passes through the list until no more swaps are needed (i.e., the list is sorted).
+    - key / reverse work as in sorted() (see sort_by_key).
     - Time Complexity: O(n^2) in Worst and Average Case, O(n) in Best Case (when array is already sorted).
     - Space Complexity: O(1) - In-place sorting.
     """
+    if key is not None or reverse:
+        return sort_by_key(bubble_sort, arr, key, reverse)
     n = len(arr)
     for i in range(n):
         swapped = False  # Flag to detect if any swap occurs in this pass
@@ -23,55 +44,157 @@ def bubble_sort(arr):
             break  # No swaps mean the array is already sorted
     return arr
 
-def merge_sort(arr):
+def merge_sort(arr, natural=False, key=None, reverse=False):
     """
-    Merge Sort Algorithm:
-    - A Divide and Conquer algorithm that recursively divides the array in half, sorts the halves, and merges them.
-    - Time Complexity: O(n log n) for all cases.
-    - Space Complexity: O(n) - Not in-place sorting.
+    Merge Sort Algorithm (bottom-up):
+    - Treats the array as a sequence of sorted runs and repeatedly merges neighbouring runs
+      until one run is left. Starts from blocks of SMALL_SORT_CUTOFFS["merge_sort"] elements
+      sorted with insertion sort.
+    - natural=True first detects the ascending (and strictly descending, which are reversed)
+      runs already present, so nearly sorted input needs only a few passes - O(n) when sorted.
+      Runs shorter than the cutoff are extended to it with insertion sort.
+    - Merges ping-pong between arr and a single auxiliary buffer allocated once, galloping
+      through runs that win many times in a row (see _merge).
+    - Stable: equal elements keep their original order.
+    - key / reverse work as in sorted() (see sort_by_key).
+    - Time Complexity: O(n log n) for all cases (O(n log r) for r natural runs).
+    - Space Complexity: O(n) - one auxiliary buffer.
+    - numpy.ndarray / array.array / memoryview input is sorted in place with NumPy's stable sort.
     """
-    if len(arr) > 1:
-        mid = len(arr) // 2  # Find the midpoint
-        left_half = arr[:mid]  # Left half of the array
-        right_half = arr[mid:]  # Right half of the array
-
-        # Recursively split and sort the left and right halves
-        merge_sort(left_half)
-        merge_sort(right_half)
-
-        # Merge the two halves back together in sorted order
-        i = j = k = 0
-        while i < len(left_half) and j < len(right_half):
-            if left_half[i] < right_half[j]:
-                arr[k] = left_half[i]
-                i += 1
+    if key is not None:
+        return sort_by_key(merge_sort, arr, key, reverse, natural)
+    if _uses_array_backend(arr):
+        return _array_merge_sort(arr, reverse)
+    if reverse:
+        return sort_by_key(merge_sort, arr, key, reverse, natural)
+    if isinstance(arr, memoryview):
+        return _sort_memoryview(merge_sort, arr, natural)
+    n = len(arr)
+    if n <= 1:
+        return arr
+    cutoff = SMALL_SORT_CUTOFFS["merge_sort"]
+    # Run boundaries: run k is arr[bounds[k]:bounds[k + 1]]
+    if natural:
+        bounds = find_runs(arr, cutoff)
+    else:
+        bounds = list(range(0, n, cutoff)) + [n]
+        for lo in bounds[:-1]:
+            insertion_sort(arr, lo, min(lo + cutoff, n))
+    src = arr
+    dst = arr[:]  # The only auxiliary buffer; a copy keeps arr's container type (see instrumentation.py)
+    while len(bounds) > 2:
+        merged = [0]
+        for k in range(0, len(bounds) - 1, 2):
+            lo = bounds[k]
+            if k + 2 < len(bounds):
+                mid, hi = bounds[k + 1], bounds[k + 2]
+                _merge(src, dst, lo, mid, hi)
             else:
-                arr[k] = right_half[j]
-                j += 1
-            k += 1
+                # Odd run out - carry it over unchanged
+                hi = bounds[k + 1]
+                dst[lo:hi] = src[lo:hi]
+            merged.append(hi)
+        bounds = merged
+        src, dst = dst, src
+    if src is not arr:
+        arr[:] = src  # An odd number of passes left the result in the buffer
+    return arr
 
-        # Copy any remaining elements from left_half
-        while i < len(left_half):
-            arr[k] = left_half[i]
+def _merge(src, dst, lo, mid, hi):
+    """
+    Merges the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi] (stable).
+    - Runs that are already in order are copied without comparing their elements.
+    - Galloping: once one run has supplied MIN_GALLOP elements in a row, all of its elements
+      that go before the other run's head are found by binary search and copied as one slice,
+      so merging a short run into a long one costs O(m log n) comparisons instead of O(m + n).
+    """
+    if not src[mid] < src[mid - 1]:
+        dst[lo:hi] = src[lo:hi]
+        return
+    i, j, k = lo, mid, lo
+    wins_i = wins_j = 0  # Consecutive elements taken from each run
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+            wins_i, wins_j = 0, wins_j + 1
+            if wins_j >= MIN_GALLOP:
+                # Everything in the right run smaller than src[i] goes next (strictly, for stability)
+                end = bisect_left(src, src[i], j, hi)
+                dst[k:k + end - j] = src[j:end]
+                k += end - j
+                j = end
+                wins_j = 0
+        else:
+            dst[k] = src[i]
             i += 1
             k += 1
+            wins_i, wins_j = wins_i + 1, 0
+            if wins_i >= MIN_GALLOP and j < hi:
+                # Everything in the left run not larger than src[j] goes next
+                end = bisect_right(src, src[j], i, mid)
+                dst[k:k + end - i] = src[i:end]
+                k += end - i
+                i = end
+                wins_i = 0
+    # Copy whichever run has elements left
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
 
-        # Copy any remaining elements from right_half
-        while j < len(right_half):
-            arr[k] = right_half[j]
-            j += 1
-            k += 1
-    return arr
+def find_runs(arr, min_run=1):
+    """
+    Splits arr into maximal sorted runs for natural merge sort.
+    - Non-decreasing runs are kept; strictly decreasing runs are reversed in place
+      (strictly, so reversing never reorders equal elements).
+    - Runs shorter than min_run are extended to min_run elements (or the end of arr)
+      with insertion sort, as in Timsort.
+    - Returns the run boundaries [0, ..., len(arr)].
+    """
+    n = len(arr)
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n and arr[hi] < arr[lo]:
+            while hi < n and arr[hi] < arr[hi - 1]:
+                hi += 1
+            arr[lo:hi] = arr[lo:hi][::-1]
+        else:
+            while hi < n and not arr[hi] < arr[hi - 1]:
+                hi += 1
+        if hi - lo < min_run and hi < n:
+            hi = min(lo + min_run, n)
+            insertion_sort(arr, lo, hi)  # The prefix is already sorted, so this is cheap
+        bounds.append(hi)
+        lo = hi
+    return bounds
 
-def quick_sort(arr):
+def quick_sort(arr, in_place=False, key=None, reverse=False):
     """
     Quick Sort Algorithm:
     - Uses a pivot to partition the array into subarrays, sorting them recursively.
+    - Subarrays of SMALL_SORT_CUTOFFS["quick_sort"] elements or fewer are insertion sorted.
     - Time Complexity: O(n log n) on average, O(n^2) in the worst case.
     - Space Complexity: O(log n) due to recursion.
+    - in_place=True sorts arr itself with introsort instead (O(n log n) worst case, no new lists).
+    - key / reverse work as in sorted() and make the sort stable (see sort_by_key).
+    - numpy.ndarray / array.array / memoryview input is sorted in place with NumPy's introsort.
     """
+    if key is not None:
+        return sort_by_key(quick_sort, arr, key, reverse, in_place, in_place=in_place)
+    if _uses_array_backend(arr):
+        return _array_quick_sort(arr, reverse)
+    if reverse:
+        return sort_by_key(quick_sort, arr, key, reverse, in_place, in_place=in_place)
+    if in_place:
+        return introsort(arr)
     if len(arr) <= 1:
         return arr
+    if len(arr) <= SMALL_SORT_CUTOFFS["quick_sort"]:
+        return insertion_sort(arr[:])
     pivot = arr[len(arr) // 2]  # Choose middle element as pivot
     left = [x for x in arr if x < pivot]  # Elements less than pivot
     middle = [x for x in arr if x == pivot]  # Elements equal to pivot
@@ -79,47 +202,425 @@ def quick_sort(arr):
     # Recursively sort left and right subarrays, and combine them with middle
     return quick_sort(left) + middle + quick_sort(right)
 
-def counting_sort(arr, exp1):
+def introsort(arr, key=None, reverse=False):
     """
-    Helper function for Radix Sort - Counting Sort based on significant digits (exp).
+    Introsort (in-place Quick Sort):
+    - Partitions arr in place around a median-of-three pivot (ninther for large ranges).
+    - Partitions of SMALL_SORT_CUTOFFS["introsort"] elements or fewer are finished with insertion sort.
+    - Falls back to heap sort for a range once the partitioning depth exceeds 2*log2(n).
+    - Uses an explicit stack instead of recursion; the larger side is pushed and the smaller
+      side is processed next, so the stack never holds more than log2(n) ranges.
+    - key / reverse work as in sorted() and make the sort stable (see sort_by_key).
+    - Time Complexity: O(n log n) in the worst case.
+    - Space Complexity: O(log n) for the stack.
     """
+    if key is not None or reverse:
+        return sort_by_key(introsort, arr, key, reverse)
     n = len(arr)
-    output = [0] * n  # Output array to hold the sorted numbers
-    count = [0] * 10  # Count array to store occurrences of digits
+    if n <= 1:
+        return arr
+    cutoff = SMALL_SORT_CUTOFFS["introsort"]
+    stack = [(0, n, 2 * n.bit_length())]  # (lo, hi, depth budget), hi exclusive
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo > cutoff:
+            if depth == 0:
+                # Too many unbalanced partitions - heap sort guarantees O(n log n)
+                heap_sort(arr, lo, hi)
+                lo = hi
+                break
+            depth -= 1
+            mid = _partition(arr, lo, hi)
+            # Keep the smaller side for this loop so the stack stays logarithmic
+            if mid - lo < hi - mid:
+                stack.append((mid, hi, depth))
+                hi = mid
+            else:
+                stack.append((lo, mid, depth))
+                lo = mid
+        insertion_sort(arr, lo, hi)
+    return arr
+
+def _median_of_three(arr, a, b, c):
+    """Returns whichever of the indices a, b, c holds the median value."""
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+def _partition(arr, lo, hi):
+    """
+    Hoare partition of arr[lo:hi].
+    - The pivot is the median of three samples, or Tukey's ninther (median of three
+      medians of three) when the range is larger than 128 elements.
+    - Returns mid such that arr[lo:mid] <= pivot <= arr[mid:hi], with both sides non-empty.
+    """
+    last = hi - 1
+    middle = lo + (hi - lo) // 2
+    if hi - lo > 128:
+        step = (hi - lo) // 8
+        p = _median_of_three(arr,
+                             _median_of_three(arr, lo, lo + step, lo + 2 * step),
+                             _median_of_three(arr, middle - step, middle, middle + step),
+                             _median_of_three(arr, last - 2 * step, last - step, last))
+    else:
+        p = _median_of_three(arr, lo, middle, last)
+    # Moving the pivot to the front guarantees the scan below never returns an empty side
+    arr[lo], arr[p] = arr[p], arr[lo]
+    pivot = arr[lo]
+    i = lo - 1
+    j = hi
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < arr[j]:
+            j -= 1
+        if i >= j:
+            return j + 1
+        arr[i], arr[j] = arr[j], arr[i]
+
+def load_cutoffs(path):
+    """Updates SMALL_SORT_CUTOFFS with the values saved by `python benchmark.py --tune-cutoffs`."""
+    with open(path) as f:
+        SMALL_SORT_CUTOFFS.update(json.load(f))
+
+def insertion_sort(arr, lo=0, hi=None):
+    """
+    Insertion Sort Algorithm (on arr[lo:hi]):
+    - Shifts each element left until it sits after the last smaller-or-equal element.
+    - Time Complexity: O(n^2) in the worst case, O(n) when already sorted.
+    - Space Complexity: O(1) - In-place and stable.
+    """
+    if hi is None:
+        hi = len(arr)
+    for i in range(lo + 1, hi):
+        value = arr[i]
+        j = i - 1
+        while j >= lo and value < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = value
+    return arr
+
+def heap_sort(arr, lo=0, hi=None):
+    """
+    Heap Sort Algorithm (on arr[lo:hi]):
+    - Builds a max-heap in place, then repeatedly moves the maximum to the end of the range.
+    - Time Complexity: O(n log n) in all cases.
+    - Space Complexity: O(1) - In-place sorting.
+    """
+    if hi is None:
+        hi = len(arr)
+    n = hi - lo
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+    return arr
+
+def _sift_down(arr, lo, root, size):
+    """Restores the max-heap property below root for the heap stored at arr[lo:lo + size]."""
+    value = arr[lo + root]
+    child = 2 * root + 1
+    while child < size:
+        if child + 1 < size and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if not value < arr[lo + child]:
+            break
+        arr[lo + root] = arr[lo + child]
+        root = child
+        child = 2 * root + 1
+    arr[lo + root] = value
+
+def counting_sort(keys, values, shift, bits):
+    """
+    Helper function for Radix Sort - one stable Counting Sort pass on the digit
+    (key >> shift) & (2**bits - 1).
+    - keys are non-negative ints; values are the elements they belong to and move with them.
+    - Returns the reordered (keys, values), or the inputs unchanged when every key has the
+      same digit, since such a pass would not move anything.
+    """
+    n = len(keys)
+    mask = (1 << bits) - 1
+    digits = [(k >> shift) & mask for k in keys]
+    count = [0] * (mask + 1)  # Count array to store occurrences of each digit
 
     # Store count of occurrences
-    for i in range(n):
-        index = arr[i] // exp1
-        count[(index) % 10] += 1
-
-    # Update count to store cumulative sum
-    for i in range(1, 10):
-        count[i] += count[i - 1]
-
-    # Build the output array
-    i = n - 1
-    while i >= 0:
-        index = arr[i] // exp1
-        output[count[(index) % 10] - 1] = arr[i]
-        count[(index) % 10] -= 1
-        i -= 1
-
-    # Copy the sorted numbers back to the original array
-    for i in range(n):
-        arr[i] = output[i]
+    for d in digits:
+        count[d] += 1
+    if max(count) == n:
+        return keys, values  # Constant digit - skip the pass
+
+    # Turn the counts into the first output position of each digit
+    total = 0
+    for d in range(mask + 1):
+        count[d], total = total, total + count[d]
 
-def radix_sort(arr):
+    # Scatter front to back so equal digits keep their order (stability)
+    out_keys = [0] * n
+    out_values = values[:]  # Overwritten below; copied so it keeps the container type of values
+    for k, v, d in zip(keys, values, digits):
+        pos = count[d]
+        out_keys[pos] = k
+        out_values[pos] = v
+        count[d] = pos + 1
+    return out_keys, out_values
+
+def radix_key_bits(radix):
+    """Returns the number of key bits consumed per pass for a power-of-two radix (2 to 65536)."""
+    bits = radix.bit_length() - 1
+    if radix < 2 or radix > 65536 or radix != 1 << bits:
+        raise ValueError(f"radix must be a power of two between 2 and 65536, got {radix}")
+    return bits
+
+def radix_keys(arr, reverse=False):
+    """
+    Maps the elements of arr to non-negative integer keys with the same ordering.
+    - Integers (including negative and 64-bit values) are shifted by the minimum.
+    - Floats are reinterpreted as IEEE-754 bits: negative numbers have all bits flipped and
+      positive numbers have the sign bit set, so unsigned order matches numeric order.
+    - reverse=True subtracts every key from the largest, so ascending key order is descending order.
+    """
+    if all(isinstance(x, int) for x in arr):
+        keys = arr
+    else:
+        sign = 1 << 63
+        raw = array("Q", array("d", arr).tobytes())
+        keys = [b ^ 0xFFFFFFFFFFFFFFFF if b & sign else b | sign for b in raw]
+    low, high = min(keys), max(keys)
+    if reverse:
+        return [high - k for k in keys]
+    return [k - low for k in keys]
+
+def radix_sort(arr, radix=256, key=None, reverse=False):
     """
     Radix Sort Algorithm:
-    - Sorts numbers by processing individual digits starting from the least significant digit.
-    - Time Complexity: O(d*(n+k)), where d is the number of digits, n is the number of elements, and k is the base.
+    - Sorts numbers by processing the digits of their keys starting from the least significant digit.
+    - radix is a power of two (256 = one byte per pass, 65536 = one 16-bit word per pass).
+    - Handles negative numbers, the full signed 64-bit range and floats (see radix_keys).
+    - key maps each element to its sort key, computed once per element. A key may also be a
+      fixed-width tuple of numbers such as (int, int): fields are sorted last to first, and
+      stability carries the order of the later fields through the earlier ones.
+    - Stable, also with reverse=True (keys are complemented instead of the output reversed).
+    - Passes whose digit is the same for every key are skipped.
+    - Time Complexity: O(d*(n+k)), where d is the number of digits, n is the number of elements, and k is the radix.
     - Space Complexity: O(n+k).
+    - numpy.ndarray / array.array / memoryview integer or float input is sorted in place with the digit
+      counting and scatter done in bulk by NumPy.
+    """
+    bits = radix_key_bits(radix)
+    if key is None and _uses_array_backend(arr):
+        return _array_radix_sort(arr, bits, reverse)
+    if isinstance(arr, memoryview):
+        return _sort_memoryview(radix_sort, arr, radix, key, reverse)
+    if len(arr) <= 1:
+        return arr
+    keys = arr if key is None else [key(x) for x in arr]
+    if isinstance(keys[0], tuple):
+        width = len(keys[0])
+        if not all(isinstance(k, tuple) and len(k) == width for k in keys):
+            raise ValueError("radix_sort composite keys must all be tuples of the same length")
+        # One LSD sort per field, least significant field first, carrying element indices
+        order = list(range(len(arr)))
+        for field in reversed(list(zip(*keys))):
+            field_keys = radix_keys(field, reverse)
+            order = _radix_passes([field_keys[i] for i in order], order, bits)
+        _write_back(arr, [arr[i] for i in order])
+    else:
+        # With a key, arr may be an ndarray, whose arr[:] is a view rather than a copy
+        values = arr[:] if key is None else list(arr)
+        _write_back(arr, _radix_passes(radix_keys(keys, reverse), values, bits))
+    return arr
+
+def _radix_passes(keys, values, bits):
+    """Runs the LSD counting sort passes over non-negative keys; returns values in key order."""
+    max_key = max(keys)  # Determines how many digits (passes) are needed
+    shift = 0
+    while max_key >> shift > 0:
+        keys, values = counting_sort(keys, values, shift, bits)
+        shift += bits
+    return values
+
+# Key Functions
+# The comparison sorts take key= and reverse= like sorted(). Each element's key is computed
+# once, and the sort runs on (key, position) pairs: positions are unique, so ties on the key
+# never compare the elements themselves and every algorithm, quick_sort included, is stable.
+
+def sort_by_key(func, arr, key=None, reverse=False, *args, in_place=True):
+    """
+    Decorate-sort-undecorate:
+    - Sorts the (key(element), position) pairs of arr with func(pairs, *args), then puts
+      the elements back in the order of their pairs.
+    - reverse=True decorates arr back to front and reverses the result, so equal keys
+      keep their original order, as with sorted(reverse=True).
+    - Writes the result into arr and returns arr, or returns it as a new list when
+      in_place=False (quick_sort's default out-of-place mode).
+    - Time Complexity: that of func, plus O(n) key calls. Space Complexity: O(n).
+    """
+    items = list(arr)
+    if reverse:
+        items.reverse()
+    if key is None:
+        pairs = [(x, i) for i, x in enumerate(items)]
+    else:
+        pairs = [(key(x), i) for i, x in enumerate(items)]
+    pairs = func(pairs, *args)
+    result = [items[i] for _, i in pairs]
+    if reverse:
+        result.reverse()
+    if not in_place:
+        return result
+    _write_back(arr, result)
+    return arr
+
+def _write_back(arr, values):
+    """Replaces the contents of arr with the list values, keeping arr's container type."""
+    if isinstance(arr, array):
+        values = array(arr.typecode, values)
+    elif isinstance(arr, memoryview):
+        values = array(arr.format, values)
+    arr[:] = values
+
+# Array Backends
+# Used when the input is a numpy.ndarray, array.array or memoryview and NumPy is installed.
+# Each backend sorts the buffer in place and returns the object it was given.
+
+def _uses_array_backend(arr):
+    """Returns True if arr should be sorted by the NumPy backends instead of the Python loops."""
+    return np is not None and isinstance(arr, (np.ndarray, array, memoryview))
+
+def _as_ndarray(arr, reverse=False):
+    """
+    Returns a writable 1-D ndarray sharing memory with arr (no copy).
+    - reverse=True returns a reversed view: sorting it ascending sorts arr descending, and
+      a stable sort keeps equal elements in their original order.
     """
-    max1 = max(arr)  # Find the maximum number to determine the number of digits
-    exp = 1
-    while max1 // exp > 0:
-        counting_sort(arr, exp)
-        exp *= 10
+    if isinstance(arr, array):
+        arr = np.frombuffer(arr, dtype=arr.typecode)
+    elif isinstance(arr, memoryview):
+        arr = np.frombuffer(arr, dtype=arr.format)
+    return arr[::-1] if reverse else arr
+
+def _sort_memoryview(func, view, *args):
+    """
+    Pure-Python path for memoryviews (without NumPy): slicing a memoryview gives another view
+    rather than a copy, so the algorithms that copy their input sort an array copy instead,
+    which is then written back into the view's buffer.
+    """
+    data = array(view.format, view.tobytes())
+    func(data, *args)
+    view[:] = data
+    return view
+
+# Typed-Array Input
+# Loaders and generators that produce array('q') data directly: 8 bytes per element, versus
+# roughly 36 for a list slot plus an int object, and no per-element Python work when NumPy
+# is installed. The results can be passed straight to the sorting functions.
+
+def parse_array(text, typecode="q"):
+    """
+    Parses whitespace-separated integers (str or bytes) into an array(typecode).
+    - With NumPy the whole text is parsed in C in one call; otherwise token by token.
+    - Raises ValueError on a token that is not an integer or does not fit the typecode.
+    - Empty or blank text gives an empty array.
+    """
+    if np is not None and text and not text.isspace():  # NumPy rejects blank text
+        with warnings.catch_warnings():
+            # NumPy only warns when it stops at an unparseable token; treat that as an error
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                values = np.fromstring(text, dtype=typecode, sep=" ")
+            except DeprecationWarning as error:
+                raise ValueError(str(error)) from None
+        limits = np.iinfo(values.dtype)
+        if values.size and (values.max() == limits.max or values.min() == limits.min):
+            # NumPy clamps out-of-range tokens to the limits, so recheck such input exactly
+            return _parse_exact(text, typecode)
+        return array(typecode, values.tobytes())
+    return _parse_exact(text, typecode)
+
+def _parse_exact(text, typecode):
+    """Parses token by token with int(); raises ValueError for values that do not fit the typecode."""
+    try:
+        return array(typecode, map(int, text.split()))
+    except OverflowError:
+        raise ValueError(f"a value does not fit in array({typecode!r})") from None
+
+def load_array(path, fmt="text", typecode="q"):
+    """
+    Bulk-loads the integers of a file into an array(typecode).
+    - fmt "binary": native-endian items of the typecode's width, read in one call.
+    - fmt "text": whitespace-separated integers, parsed with parse_array.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if fmt == "binary":
+        arr = array(typecode)
+        if len(data) % arr.itemsize:
+            raise ValueError(f"{path} is not a whole number of {arr.itemsize}-byte items")
+        arr.frombytes(data)
+        return arr
+    return parse_array(data, typecode)
+
+def random_array(size, low=1, high=1000, seed=None):
+    """
+    Returns an array('q') of size random integers in [low, high].
+    - With NumPy they are generated in one vectorized call; otherwise one by one.
+    """
+    if np is not None:
+        values = np.random.default_rng(seed).integers(low, high, size, dtype=np.int64, endpoint=True)
+        return array("q", values.tobytes())
+    rng = random.Random(seed)
+    return array("q", (rng.randint(low, high) for _ in range(size)))
+
+def _array_merge_sort(arr, reverse=False):
+    """NumPy backend for merge_sort - stable O(n log n) sort."""
+    _as_ndarray(arr, reverse).sort(kind="stable")
+    return arr
+
+def _array_quick_sort(arr, reverse=False):
+    """NumPy backend for quick_sort - introsort, O(n log n) worst case."""
+    _as_ndarray(arr, reverse).sort(kind="quicksort")
+    return arr
+
+def _array_radix_sort(arr, bits=8, reverse=False):
+    """
+    NumPy backend for radix_sort - LSD radix sort over digits of the given bit width.
+    - Signed keys are mapped to unsigned order by flipping the sign bit; floats use the
+      same IEEE-754 bit mapping as radix_keys.
+    - Passes where every key has the same digit are skipped.
+    - Time Complexity: O(w/b*n) for w-bit keys and b-bit digits. Space Complexity: O(n).
+    """
+    a = _as_ndarray(arr, reverse)
+    if a.dtype.kind not in "iuf":
+        raise TypeError(f"radix_sort requires integer or float keys, got {a.dtype}")
+    if len(a) <= 1:
+        return arr
+    width = 8 * a.dtype.itemsize
+    bits = min(bits, width)
+    keys = a.view(f"u{a.dtype.itemsize}")
+    sign = np.array(1 << (width - 1), dtype=keys.dtype)
+    if a.dtype.kind == "i":
+        keys = keys ^ sign
+    elif a.dtype.kind == "f":
+        keys = np.where(keys & sign, ~keys, keys | sign)
+    digit_type = np.uint8 if bits <= 8 else np.uint16
+    mask = (1 << bits) - 1
+    order = np.arange(len(a))
+    for shift in range(0, width, bits):
+        digits = ((keys[order] >> shift) & mask).astype(digit_type)
+        counts = np.bincount(digits, minlength=mask + 1)
+        if counts.max() == len(a):
+            continue  # Every key has the same digit here, so this pass would not move anything
+        # NumPy's stable sort on 8/16-bit keys is itself a counting sort (histogram, prefix sums, scatter)
+        order = order[np.argsort(digits, kind="stable")]
+    a[:] = a[order]
     return arr
 
 def linear_search(arr, target):
@@ -147,19 +648,24 @@ def measure_execution_time(func, *args):
 # Function to get array input from the user (manual or random generation)
 def get_array_input():
     """
-    Prompts the user to input an array manually or generate a random array.
-    Returns the array entered/generated.
+    Prompts the user to input an array manually, generate a random array or load one from a file.
+    Returns the array entered/generated as a list, so every algorithm is timed on the same
+    container (array('q') input would send some of them to the NumPy backends).
     """
-    choice = input("Do you want to input the array manually or generate a random array? (manual/random): ").strip().lower()
+    choice = input("Do you want to input the array manually, generate a random array or load a file? (manual/random/file): ").strip().lower()
 
     if choice == "manual":
         # Manual input of array elements
         array_str = input("Enter the array elements separated by spaces: ").strip()
-        arr = list(map(int, array_str.split()))
+        arr = list(map(int, array_str.split()))  # int() keeps arbitrary precision for typed input
     elif choice == "random":
         # Generate a random array of user-specified size
         size = int(input("Enter the size of the random array: ").strip())
-        arr = [random.randint(1, 1000) for _ in range(size)]
+        arr = random_array(size).tolist()
+    elif choice == "file":
+        # Load whitespace-separated text, or native int64 binary for files ending in .bin
+        path = input("Enter the path of the file: ").strip()
+        arr = load_array(path, "binary" if path.endswith(".bin") else "text").tolist()
     else:
         # Handle invalid input
         print("Invalid input. Please try again.")
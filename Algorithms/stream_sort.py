@@ -0,0 +1,133 @@
+import argparse
+import heapq
+import sys
+import tempfile
+from itertools import islice
+
+from external_sort import RUN_SORTERS, iter_run, reduce_runs, write_run
+from sorting_algorithms import SMALL_SORT_CUTOFFS, _partition, heap_sort, insertion_sort, introsort
+
+# Streaming Sorts
+# Sorting entry points that consume any iterable (a pipe, a log being parsed, a generator)
+# instead of a list that is already in memory, holding at most a chunk of it at a time.
+#
+# A full sort cannot produce its smallest element before it has seen the last input element,
+# so sorted_stream starts yielding once the input ends. What it avoids is materializing the
+# input: each chunk is sorted and spilled as it arrives, and the output is streamed from a
+# heap merge of the spilled runs. top_k and partial_sort do less work when only the first k
+# results are needed.
+#
+# Usage (from the Algorithms directory):
+#   grep -o '[0-9]*' app.log | python stream_sort.py --chunk-size 1000000 > sorted.txt
+#   python stream_sort.py --top 10 < numbers.txt
+
+# Elements sorted in memory at a time by sorted_stream
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def iter_numbers(lines):
+    """Lazily yields the whitespace-separated integers of an iterable of text lines (e.g. sys.stdin)."""
+    for line in lines:
+        for token in line.split():
+            yield int(token)
+
+
+def sorted_stream(iterable, chunk_size=DEFAULT_CHUNK_SIZE, algorithm="merge_sort", tmpdir=None):
+    """
+    Streaming Sort (run generation + heap merge):
+    - Reads iterable chunk_size elements at a time and sorts each chunk with `algorithm`.
+    - If the input fits in one chunk it is yielded straight from memory. Otherwise every
+      sorted chunk is spilled to a temporary run file (as in external_sort) and the output
+      is yielded from a heap-based k-way merge of the runs.
+    - Stable across chunks: heapq.merge prefers earlier runs on ties.
+    - Spilled elements must be integers that fit in a signed 64-bit int.
+    - Time Complexity: O(n log n).
+    - Space Complexity: O(chunk_size) in memory (at most two chunks are held at once),
+      O(n) on disk. The run files are removed when the generator finishes or is closed.
+    """
+    sort_run = RUN_SORTERS[algorithm]
+    items = iter(iterable)
+    run = sort_run(list(islice(items, chunk_size)))
+    chunk = list(islice(items, chunk_size))
+    if not chunk:
+        yield from run  # Everything fit in one chunk - no need to touch the disk
+        return
+    with tempfile.TemporaryDirectory(dir=tmpdir, prefix="sorted_stream_") as workdir:
+        runs = [write_run(run, workdir)]
+        del run
+        while chunk:
+            runs.append(write_run(sort_run(chunk), workdir))
+            chunk = list(islice(items, chunk_size))
+        runs = reduce_runs(runs, workdir)
+        yield from heapq.merge(*(iter_run(path) for path in runs))
+
+
+def top_k(iterable, k, largest=False):
+    """
+    Top-k Selection:
+    - Returns the k smallest (or largest) elements of iterable in sorted order
+      (descending when largest=True), keeping only a heap of k elements while streaming.
+    - Time Complexity: O(n log k).
+    - Space Complexity: O(k).
+    """
+    if largest:
+        return heapq.nlargest(k, iterable)
+    return heapq.nsmallest(k, iterable)
+
+
+def partial_sort(arr, k):
+    """
+    Partial Sort (quickselect + sort of the prefix):
+    - Rearranges arr in place so arr[:k] holds its k smallest elements in sorted order;
+      the order of arr[k:] is unspecified.
+    - Repeatedly partitions (as in introsort) only the side that contains position k, then
+      sorts the first k elements. Falls back to heap sort for a range after 2*log2(n)
+      unbalanced partitions.
+    - Time Complexity: O(n + k log k) on average, O(n log n) in the worst case.
+    - Space Complexity: O(1) besides the sort of the prefix.
+    """
+    n = len(arr)
+    k = max(0, min(k, n))
+    if k == 0:
+        return arr
+    lo, hi = 0, n
+    depth = 2 * n.bit_length()
+    while hi - lo > SMALL_SORT_CUTOFFS["introsort"]:
+        if depth == 0:
+            heap_sort(arr, lo, hi)
+            break
+        depth -= 1
+        mid = _partition(arr, lo, hi)
+        if k <= mid:
+            hi = mid  # Everything in arr[mid:] is at least as large as the k smallest
+        else:
+            lo = mid
+    else:
+        insertion_sort(arr, lo, hi)
+    arr[:k] = introsort(arr[:k])
+    return arr
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sort integers read from standard input, one chunk in memory at a time.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="elements sorted in memory before a run is spilled to disk")
+    parser.add_argument("--algorithm", choices=list(RUN_SORTERS), default="merge_sort",
+                        help="algorithm used to sort each chunk")
+    parser.add_argument("--top", type=int, help="only print the TOP smallest integers")
+    parser.add_argument("--largest", action="store_true", help="with --top, print the largest integers instead")
+    parser.add_argument("--tmpdir", help="directory for the temporary run files")
+    args = parser.parse_args(argv)
+
+    numbers = iter_numbers(sys.stdin)
+    if args.top is not None:
+        output = top_k(numbers, args.top, args.largest)
+    else:
+        output = sorted_stream(numbers, args.chunk_size, args.algorithm, args.tmpdir)
+    write = sys.stdout.write
+    for value in output:
+        write(f"{value}\n")
+
+
+if __name__ == "__main__":
+    main()
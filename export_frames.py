@@ -0,0 +1,183 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Headless: frames are rendered off-screen
+
+import argparse
+import random
+import shlex
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+from group3visual import DrawInformation, draw_frame, event_colors
+from sort_trace import ALGORITHMS, COMPARE, Replayer, TraceBuffer, apply_event, record
+
+# Offline Frame Export
+# Renders a sort trace to video frames without a window: the algorithm is recorded headlessly
+# (sort_trace.py), the frames to draw are chosen from the trace, and chunks of consecutive
+# frames are rendered in parallel worker processes onto off-screen surfaces with the same
+# drawing code as group3visual.py. Frames are written as a PNG sequence, or streamed as raw
+# RGB24 frames, in order, to the standard input of an encoder.
+#
+# Usage:
+#   python export_frames.py --algorithm merge --n 200 --output frames/
+#   python export_frames.py --algorithm quick --n 2000 --steps-per-frame 20 \
+#       --pipe "ffmpeg -y -f rawvideo -pix_fmt rgb24 -s 1280x720 -r 60 -i - quick.mp4"
+#   python export_frames.py --trace merge.trace --output frames/
+
+WIDTH, HEIGHT = 1280, 720
+
+# Frames rendered per worker task; with --pipe each task's frames are held in memory
+# (WIDTH * HEIGHT * 3 bytes each) until they are written, in order
+DEFAULT_CHUNK_FRAMES = 32
+
+
+def plan_frames(trace, steps_per_frame=1):
+    """
+    Chooses the frames of a trace the way the live visualizer does at a given speed.
+    - A frame is drawn after every steps_per_frame visible (non-compare) events and shows
+      the list at that point with the last visible event highlighted.
+    - The first frame shows the initial list and the last one the final list, unhighlighted.
+    Returns a list of (step, event) pairs: the state after `step` events, and the event to
+    highlight or None.
+    """
+    frames = [(0, None)]
+    ops = trace.events[::3]
+    visible = 0
+    for k, op in enumerate(ops):
+        if op == COMPARE:
+            continue
+        visible += 1
+        if visible % steps_per_frame == 0:
+            frames.append((k + 1, trace[k]))
+    frames.append((len(trace), None))
+    return frames
+
+
+def chunk_tasks(trace, frames, chunk_frames=DEFAULT_CHUNK_FRAMES):
+    """
+    Splits the frame plan into worker tasks of up to chunk_frames consecutive frames.
+    - Each task carries the list as it is at its first frame plus only the events between
+      its first and last frame, so workers never replay the trace from the beginning.
+    - The starting lists come from one sequential pass over the trace (Replayer).
+    Yields (first_frame_index, start_step, start_list, events, frames) tuples.
+    """
+    replayer = Replayer(trace)
+    for first in range(0, len(frames), chunk_frames):
+        chunk = frames[first:first + chunk_frames]
+        start, end = chunk[0][0], chunk[-1][0]
+        state = list(replayer.seek(start))
+        yield first, start, state, trace.events[3 * start:3 * end], chunk
+
+
+def render_chunk(task, name, total, size=(WIDTH, HEIGHT), output=None):
+    """
+    Worker: renders one chunk of frames onto an off-screen surface.
+    - Replays the chunk's events onto its starting list, drawing each planned frame.
+    - With output (a directory) the frames are saved as frame_NNNNNN.png and the number
+      written is returned; otherwise the raw RGB24 bytes of each frame are returned.
+    """
+    first, start, lst, events, frames = task
+    surface = pygame.Surface(size)
+    draw_info = DrawInformation(size[0], size[1], lst, window=surface)
+    lst = draw_info.lst
+    step = start
+    rendered = []
+    for index, (frame_step, event) in enumerate(frames, first):
+        while step < frame_step:
+            k = 3 * (step - start)
+            apply_event(lst, (events[k], events[k + 1], events[k + 2]))
+            step += 1
+        colors = event_colors(draw_info, event) if event is not None else {}
+        draw_frame(draw_info, f"{name} - Step {step}/{total}", color_positions=colors)
+        if output is None:
+            rendered.append(pygame.image.tobytes(surface, "RGB"))
+        else:
+            pygame.image.save(surface, os.path.join(output, f"frame_{index:06d}.png"))
+    return rendered if output is None else len(frames)
+
+
+def export(trace, steps_per_frame=1, output=None, pipe=None, workers=None,
+           chunk_frames=DEFAULT_CHUNK_FRAMES, size=(WIDTH, HEIGHT)):
+    """
+    Renders every planned frame of trace, in parallel worker processes.
+    - output: directory for a PNG sequence (created if needed).
+    - pipe: an encoder command line; raw RGB24 frames of the given size are written to its
+      standard input in order. At most two tasks per worker are in flight, which bounds
+      the frames held in memory.
+    Returns the number of frames exported.
+    """
+    if (output is None) == (pipe is None):
+        raise ValueError("export needs exactly one of output and pipe")
+    if output is not None:
+        os.makedirs(output, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    frames = plan_frames(trace, steps_per_frame)
+    name = trace.name.replace("_", " ").title() or "Sort"  # merge_sort -> Merge Sort
+    encoder = subprocess.Popen(shlex.split(pipe), stdin=subprocess.PIPE) if pipe else None
+    exported = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = []
+            tasks = chunk_tasks(trace, frames, chunk_frames)
+            for task in tasks:
+                pending.append(pool.submit(render_chunk, task, name, len(trace), size, output))
+                if len(pending) >= 2 * workers:
+                    exported += _collect(pending.pop(0), encoder)
+            for future in pending:
+                exported += _collect(future, encoder)
+    finally:
+        if encoder is not None:
+            encoder.stdin.close()
+            encoder.wait()
+    if encoder is not None and encoder.returncode:
+        raise RuntimeError(f"encoder exited with status {encoder.returncode}")
+    return exported
+
+
+def _collect(future, encoder):
+    """Waits for a render task; streams its frames to the encoder. Returns the frame count."""
+    result = future.result()  # Re-raises any error from a worker
+    if encoder is None:
+        return result
+    for frame in result:
+        encoder.stdin.write(frame)
+    return len(result)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a sort trace to a PNG sequence or an encoder pipe.")
+    parser.add_argument("--algorithm", choices=list(ALGORITHMS), default="merge")
+    parser.add_argument("--n", type=int, default=200)
+    parser.add_argument("--max-val", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--target", type=int, help="search target for the linear algorithm")
+    parser.add_argument("--trace", help="render a trace saved by sort_trace.py instead of recording one")
+    parser.add_argument("--steps-per-frame", type=int, default=1,
+                        help="visible (non-compare) events per frame, like the visualizer's speed")
+    parser.add_argument("--workers", type=int, help="render processes (default: one per CPU)")
+    parser.add_argument("--chunk-frames", type=int, default=DEFAULT_CHUNK_FRAMES)
+    parser.add_argument("--size", type=int, nargs=2, default=[WIDTH, HEIGHT], metavar=("WIDTH", "HEIGHT"))
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--output", help="directory for the PNG sequence")
+    output.add_argument("--pipe", help="encoder command reading raw rgb24 frames from standard input")
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        trace = TraceBuffer.load(args.trace)
+    else:
+        rng = random.Random(args.seed)
+        lst = [rng.randint(1, args.max_val) for _ in range(args.n)]
+        extra = [args.target if args.target is not None else rng.choice(lst)] if args.algorithm == "linear" else []
+        trace = record(args.algorithm, lst, *extra)
+    start = time.perf_counter()
+    count = export(trace, args.steps_per_frame, args.output, args.pipe, args.workers, args.chunk_frames,
+                   tuple(args.size))
+    print(f"Exported {count} frames of {len(trace)} events in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,18 @@
 import pygame
+import argparse
+import queue
 import random
 import math
+import socketserver
+import sys
+import threading
 import time
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; large lists are then aggregated in pure Python
+    np = None
+from sort_trace import (COMPARE, SWAP, INDEX, FOUND, OP_NAMES,
+                        bubble_sort, merge_sort, quick_sort, radix_sort, linear_search)
 # Initialize Pygame
 pygame.init()
 # Class to store and manage drawing information for the sorting visualization
@@ -26,41 +37,64 @@ class DrawInformation:
     SIDE_PAD = 100
     TOP_PAD = 150
     # Initialization function to set up the window and the list of numbers
-    def __init__(self, width, height, lst):
+    def __init__(self, width, height, lst, window=None):
         self.width = width
         self.height = height
-        self.window = pygame.display.set_mode((width, height))
-        pygame.display.set_caption("Sorting Algorithm Visualization")
+        if window is None:
+            window = pygame.display.set_mode((width, height))
+            pygame.display.set_caption("Sorting Algorithm Visualization")
+        self.window = window
+        self.glyphs = {}  # Rendered value labels, keyed by value
+        self.texts = {}  # Last rendered (text, surface) for each changing UI text
+        self.static_layer = None  # Boxes and instructions, rendered on first use
         self.set_list(lst)
     def set_list(self, lst):
-        """Sets the list to be sorted and calculates necessary dimensions."""
-        self.lst = lst
+        """Sets the list to be sorted and calculates necessary dimensions. Typed arrays and memoryviews are copied to a list."""
+        self.lst = lst if isinstance(lst, list) else lst.tolist()
+        lst = self.lst
         self.min_val = min(lst)  # Minimum value in the list
         self.max_val = max(lst)  # Maximum value in the list
-        self.block_width = round((self.width - self.SIDE_PAD) / len(lst))  # Width of each bar
-        self.block_height = math.floor((self.height - self.TOP_PAD) / (self.max_val - self.min_val))  # Height scaling
+        # Large-N mode: more elements than pixel columns, so columns are drawn instead of bars
+        self.large = len(lst) > self.width - self.SIDE_PAD
+        self.block_width = max(1, (self.width - self.SIDE_PAD) // len(lst))  # Width of each bar; rounding down keeps every bar on screen
+        value_range = max(1, self.max_val - self.min_val)  # All-equal lists still get a scale
+        self.block_height = math.floor((self.height - self.TOP_PAD) / value_range)  # Height scaling
+        if self.block_height == 0:
+            self.block_height = (self.height - self.TOP_PAD) / value_range  # Range taller than the window
         self.start_x = self.SIDE_PAD // 2  # X-axis starting position for bars
-# Function to draw the current sorting state, including UI elements like title and controls
-def draw(draw_info, algo_name, time_elapsed, sorting_completed):
-    """Draws the current sorting visualization with UI elements."""
-    draw_info.window.fill(draw_info.BACKGROUND_COLOR)
-    # Title text showing algorithm name and time elapsed (or completion message)
-    if sorting_completed:
-        title = draw_info.LARGE_FONT.render(f"{algo_name} - Completed sorting in {time_elapsed:.4f}s", True, draw_info.BLACK)
-    else:
-        title = draw_info.LARGE_FONT.render(f"{algo_name} - Time: {time_elapsed:.4f}s", True, draw_info.BLACK)
-    draw_info.window.blit(title, (draw_info.width / 2 - title.get_width() / 2, 5))
+        self.drawn = [None] * len(lst)  # (value, color) of each bar as last drawn
+        self.column_surface = pygame.Surface((self.width - self.SIDE_PAD, self.height - self.TOP_PAD))
+        self.frame_key = None  # Texts of the frame on screen; None forces the next draw()
+    def glyph(self, val):
+        """Returns the rendered label for a value, rendering it only the first time."""
+        surface = self.glyphs.get(val)
+        if surface is None:
+            surface = self.glyphs[val] = self.FONT.render(str(val), True, self.BLACK)
+        return surface
+    def render_text(self, slot, font, text):
+        """Returns the rendered text for a UI slot, re-rendering only when the text changes."""
+        cached = self.texts.get(slot)
+        if cached is None or cached[0] != text:
+            cached = self.texts[slot] = (text, font.render(text, True, self.BLACK))
+        return cached[1]
+    def label_width(self):
+        """Width of the widest value label in the current list."""
+        return max(self.glyph(self.min_val).get_width(), self.glyph(self.max_val).get_width())
+# Function to render the static parts of the interface (boxes and instructions) once
+def build_static_layer(draw_info):
+    """Renders the controls and instruction boxes onto a transparent surface that is reused every frame."""
+    layer = pygame.Surface((draw_info.width, draw_info.height), pygame.SRCALPHA)
     # Controls instruction text
-    controls_text = "R - Reset | SPACE - Start Sorting | S - Search"
+    controls_text = "R - Reset | SPACE - Start Sorting | S - Search | A - Race | P - Pause | N - Step | UP/DOWN - Speed"
     controls = draw_info.FONT.render(controls_text, True, draw_info.BLACK)
     controls_box_rect = pygame.Rect(10, 40, controls.get_width() + 20, 50)
-    pygame.draw.rect(draw_info.window, draw_info.BLACK, controls_box_rect, border_radius=10)  # Border
-    pygame.draw.rect(draw_info.window, draw_info.WHITE, controls_box_rect.inflate(-4, -4), border_radius=10)  # Inner background
-    draw_info.window.blit(controls, (controls_box_rect.x + 10, controls_box_rect.y + 10))
+    pygame.draw.rect(layer, draw_info.BLACK, controls_box_rect, border_radius=10)  # Border
+    pygame.draw.rect(layer, draw_info.WHITE, controls_box_rect.inflate(-4, -4), border_radius=10)  # Inner background
+    layer.blit(controls, (controls_box_rect.x + 10, controls_box_rect.y + 10))
     # Box for sorting algorithms and search instruction
     instruction_box_rect = pygame.Rect(10, 100, 250, 150)  # Adjust dimensions as needed
-    pygame.draw.rect(draw_info.window, draw_info.BLACK, instruction_box_rect, border_radius=10)  # Border
-    pygame.draw.rect(draw_info.window, draw_info.WHITE, instruction_box_rect.inflate(-4, -4), border_radius=10)  # Inner background
+    pygame.draw.rect(layer, draw_info.BLACK, instruction_box_rect, border_radius=10)  # Border
+    pygame.draw.rect(layer, draw_info.WHITE, instruction_box_rect.inflate(-4, -4), border_radius=10)  # Inner background
     # Sorting algorithm instructions
     sorting_texts = [
         "B - Bubble Sort", "M - Merge Sort",
@@ -69,208 +103,469 @@ def draw(draw_info, algo_name, time_elapsed, sorting_completed):
     ]
     for i, text in enumerate(sorting_texts):
         sorting_instruction = draw_info.FONT.render(text, True, draw_info.BLACK)
-        draw_info.window.blit(sorting_instruction, (instruction_box_rect.x + 10, instruction_box_rect.y + 10 + (i * 30)))
-    # Draw the list (bars) with the updated interface
-    draw_list(draw_info)
+        layer.blit(sorting_instruction, (instruction_box_rect.x + 10, instruction_box_rect.y + 10 + (i * 30)))
+    return layer
+# Function to draw the current sorting state, including UI elements like title and controls
+def draw(draw_info, algo_name, time_elapsed, sorting_completed, status="", color_positions={}):
+    """Draws the current sorting visualization with UI elements.
+    time_elapsed is the time spent in the algorithm; status is shown in the top-right corner.
+    color_positions highlights bars, e.g. the last step while paused.
+    Nothing is redrawn if the texts are unchanged and no bars were drawn since the last call."""
+    # Title text showing algorithm name and time elapsed (or completion message)
+    if sorting_completed:
+        title_text = f"{algo_name} - Completed sorting in {time_elapsed:.4f}s"
+    else:
+        title_text = f"{algo_name} - Time: {time_elapsed:.4f}s"
+    if draw_info.frame_key == (title_text, status):
+        return  # The screen already shows exactly this frame
+    draw_frame(draw_info, title_text, status, color_positions)
     pygame.display.update()
+    draw_info.frame_key = (title_text, status)
+# Function to render a whole frame onto draw_info.window without touching the display
+def draw_frame(draw_info, title_text, status="", color_positions={}):
+    """Draws the title, status, instructions and bars (with optional highlights) onto the window
+    surface. Also used by export_frames.py to render off-screen surfaces."""
+    draw_info.window.fill(draw_info.BACKGROUND_COLOR)
+    title = draw_info.render_text("title", draw_info.LARGE_FONT, title_text)
+    draw_info.window.blit(title, (draw_info.width / 2 - title.get_width() / 2, 5))
+    # Speed, wall-clock time and pause state
+    if status:
+        status_text = draw_info.render_text("status", draw_info.FONT, status)
+        draw_info.window.blit(status_text, (draw_info.width - status_text.get_width() - 10, 60))
+    # Boxes and instructions never change, so they are rendered once and reused
+    if draw_info.static_layer is None:
+        draw_info.static_layer = build_static_layer(draw_info)
+    draw_info.window.blit(draw_info.static_layer, (0, 0))
+    # Draw the list (bars) with the updated interface
+    draw_list(draw_info, color_positions)
 # Function to draw the list of bars with optional color highlights for certain bars
 def draw_list(draw_info, color_positions={}, clear_bg=False):
-    """Draws the list of bars representing the array."""
-    lst = draw_info.lst
+    """Draws the list of bars representing the array.
+    With clear_bg, only bars whose value or color changed since the last frame are redrawn,
+    and only their rectangles are pushed to the display."""
     if clear_bg:
-        clear_rect = (draw_info.SIDE_PAD // 2, draw_info.TOP_PAD,
-                      draw_info.width - draw_info.SIDE_PAD, draw_info.height - draw_info.TOP_PAD)
-        pygame.draw.rect(draw_info.window, draw_info.BACKGROUND_COLOR, clear_rect)
-    for i, val in enumerate(lst):
-        x = draw_info.start_x + i * draw_info.block_width
-        y = draw_info.height - (val - draw_info.min_val) * draw_info.block_height
-        color = draw_info.GRADIENTS[i % 3]
-        if i in color_positions:
-            color = color_positions[i]
-        pygame.draw.rect(draw_info.window, color, (x, y, draw_info.block_width, draw_info.height - y))
-        # Draw the value on top of the bar
-        value_surface = draw_info.FONT.render(str(val), True, draw_info.BLACK)
-        value_x = x + (draw_info.block_width // 2) - (value_surface.get_width() // 2)  # Center the text
-        value_y = y - value_surface.get_height() - 5  # Position it above the bar
-        # Only draw the value if it is above the top of the window
-        if value_y >= draw_info.TOP_PAD:
-            draw_info.window.blit(value_surface, (value_x, value_y))
-    if clear_bg:
-        pygame.display.update()  # Refresh the display if background is cleared
-# Function to generate a random list of integers within a specified range
-def generate_starting_list(n, min_val, max_val):
-    """Generates a list of random integers within specified range."""
-    return [random.randint(min_val, max_val) for _ in range(n)]  # Generate list of random integers
-# Sorting Algorithms
-def bubble_sort(draw_info):
-    """
-    Bubble Sort Algorithm Visualization:
-    Time Complexity: O(n^2) in the worst case, O(n) in the best case (already sorted array).
-    Space Complexity: O(1) as it sorts in place.
-    """
+        draw_info.frame_key = None  # The screen no longer matches the last full frame
+    if draw_info.large:
+        draw_columns(draw_info, color_positions, clear_bg)
+        return
     lst = draw_info.lst
-    n = len(lst)
-    # Bubble sort process with two loops
-    for i in range(n - 1):
-        for j in range(n - 1 - i):
-            num1 = lst[j]
-            num2 = lst[j + 1]
-            # Swap adjacent elements if they are in the wrong order
-            if num1 > num2:
-                lst[j], lst[j + 1] = lst[j + 1], lst[j]
-                # Visualize the swap by highlighting the swapped bars
-                draw_list(draw_info, {j: draw_info.BLUE, j + 1: draw_info.RED}, True)
-                yield True  # Yield to allow drawing the swap step
-    return lst
-def merge_sort(draw_info, lst, l, r):
-    """
-    Merge Sort Algorithm Visualization:
-    Time Complexity: O(n log n) in all cases.
-    Space Complexity: O(n) due to the use of auxiliary arrays.
-    """
-    if l >= r:
+    gradients = draw_info.GRADIENTS
+    if not clear_bg:
+        # Full redraw (the caller has already cleared the window)
+        for i, val in enumerate(lst):
+            draw_bar(draw_info, i, val, color_positions.get(i, gradients[i % 3]))
+        draw_info.drawn = [(val, color_positions.get(i, gradients[i % 3])) for i, val in enumerate(lst)]
+        return
+    drawn = draw_info.drawn
+    changed = [i for i, val in enumerate(lst) if drawn[i] != (val, color_positions.get(i, gradients[i % 3]))]
+    if not changed:
         return
-    # Divide the array into two halves recursively
-    mid = (l + r) // 2
-    yield from merge_sort(draw_info, lst, l, mid)
-    yield from merge_sort(draw_info, lst, mid + 1, r)
-    yield from merge(draw_info, lst, l, mid, r)
-def merge(draw_info, lst, l, mid, r):
-    """
-    Merge step for Merge Sort: Merges two sorted halves.
-    """
-    left = lst[l:mid + 1]
-    right = lst[mid + 1:r + 1]
-    i = j = 0
-    k = l
-    # Merge the two halves by comparing elements
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            lst[k] = left[i]
-            i += 1
+    # Group neighbouring changed bars into spans so each span is one dirty rectangle
+    spans = []
+    for i in changed:
+        if spans and i - spans[-1][1] <= 1:
+            spans[-1][1] = i
         else:
-            lst[k] = right[j]
-            j += 1
-        k += 1
-        # Visualize the merge process
-        draw_list(draw_info, {k - 1: draw_info.BLUE}, True)
-        yield True
-    # Copy any remaining elements from left
-    while i < len(left):
-        lst[k] = left[i]
-        i += 1
-        k += 1
-        draw_list(draw_info, {k - 1: draw_info.BLUE}, True)
-        yield True
-    # Copy any remaining elements from right
-    while j < len(right):
-        lst[k] = right[j]
-        j += 1
-        k += 1
-        draw_list(draw_info, {k - 1: draw_info.BLUE}, True)
-        yield True
-def quick_sort(draw_info, lst, low, high):
-    """
-    Quick Sort Algorithm Visualization:
-    Time Complexity: O(n log n) on average, O(n^2) in the worst case (already sorted array).
-    Space Complexity: O(log n) due to recursion.
-    """
-    if low < high:
-        # Partition the array and get the pivot index
-        pi = yield from partition(draw_info, lst, low, high)
-        # Recursively sort the elements before and after the pivot
-        yield from quick_sort(draw_info, lst, low, pi - 1)
-        yield from quick_sort(draw_info, lst, pi + 1, high)
-def partition(draw_info, lst, low, high):
-    """
-    Split the array into parts based on a pivot for Quick Sort.
-    """
-    pivot = lst[high]
-    i = low - 1
-    # Rearrange elements based on the pivot
-    for j in range(low, high):
-        if lst[j] <= pivot:
-            i += 1
-            lst[i], lst[j] = lst[j], lst[i]
-            draw_list(draw_info, {i: draw_info.BLUE, j: draw_info.RED}, True)
-            yield True
-    # Place the pivot element in its correct position
-    lst[i + 1], lst[high] = lst[high], lst[i + 1]
-    draw_list(draw_info, {i + 1: draw_info.BLUE, high: draw_info.RED}, True)
-    yield True
-    return i + 1
-def counting_sort(draw_info, lst, exp):
-    """
-    Helper function for Radix Sort to perform Counting Sort based on significant digits.
-    Time Complexity: O(n), where n is the number of elements.
-    Space Complexity: O(n + k), where k is the number of digits (range of the count).
-    """
-    n = len(lst)
-    output = [0] * n  # Output array to store sorted numbers
-    count = [0] * 10  # Count array to store occurrences of each digit
-    # Count occurrences of digits
-    for i in range(n):
-        index = lst[i] // exp
-        count[index % 10] += 1
-        draw_list(draw_info, {i: draw_info.BLUE}, True)
-        yield True
-    # Update the count array to contain positions of digits
-    for i in range(1, 10):
-        count[i] += count[i - 1]
-        yield True
-    # Build the output array by placing elements in correct positions
-    i = n - 1
-    while i >= 0:
-        index = lst[i] // exp
-        output[count[index % 10] - 1] = lst[i]
-        count[index % 10] -= 1
-        i -= 1
-        yield True
-    # Copy the output array back to the original list
-    for i in range(n):
-        lst[i] = output[i]
-        draw_list(draw_info, {i: draw_info.GREEN}, True)
-        yield True
-def radix_sort(draw_info):
-    """
-    Radix Sort Algorithm Visualization:
-    Time Complexity: O(d * (n + k)), where d is the number of digits, n is the number of elements, and k is the base.
-    Space Complexity: O(n + k) due to auxiliary storage.
-    """
+            spans.append([i, i])
+    # Value labels can be wider than a bar, so neighbours whose labels reach into a span are redrawn too
+    overhang = max(0, (draw_info.label_width() - draw_info.block_width) // 2 + 1)
+    reach = -(-2 * overhang // max(1, draw_info.block_width))
+    bar_area = pygame.Rect(draw_info.SIDE_PAD // 2, draw_info.TOP_PAD,
+                           draw_info.width - draw_info.SIDE_PAD, draw_info.height - draw_info.TOP_PAD)
+    dirty = []
+    for first, last in spans:
+        x = draw_info.start_x + first * draw_info.block_width - overhang
+        width = (last - first + 1) * draw_info.block_width + 2 * overhang
+        rect = pygame.Rect(x, draw_info.TOP_PAD, width, draw_info.height - draw_info.TOP_PAD).clip(bar_area)
+        draw_info.window.set_clip(rect)
+        draw_info.window.fill(draw_info.BACKGROUND_COLOR, rect)
+        for i in range(max(0, first - reach), min(len(lst), last + reach + 1)):
+            color = color_positions.get(i, gradients[i % 3])
+            draw_bar(draw_info, i, lst[i], color)
+            drawn[i] = (lst[i], color)
+        dirty.append(rect)
+    draw_info.window.set_clip(None)
+    update_display(draw_info, dirty)  # Refresh only the changed rectangles
+# Function to push changed parts of a drawing surface to the screen
+def update_display(draw_info, rects):
+    """Updates the given rectangles of draw_info.window on the display.
+    The window may be a pane (subsurface) of the display, so rectangles are moved by its offset."""
+    dx, dy = draw_info.window.get_abs_offset()
+    pygame.display.update([rect.move(dx, dy) for rect in rects])
+# Function to draw a list with more elements than pixel columns
+def draw_columns(draw_info, color_positions={}, clear_bg=False):
+    """Large-N rendering: the elements are split into one group per pixel column and each column
+    shows the group's minimum (dark), mean (mid) and maximum (light) as stacked shades.
+    The whole bar area is built as one pixel array and blitted at once."""
     lst = draw_info.lst
-    max1 = max(lst)  # Find the maximum number to determine the number of digits
-    exp = 1
-    # Perform counting sort for every digit (starting from least significant digit)
-    while max1 // exp > 0:
-        yield from counting_sort(draw_info, lst, exp)
-        exp *= 10
-    return lst
-def linear_search(draw_info, target):
-    """
-    Linear Search Algorithm Visualization:
-    Time Complexity: O(n), where n is the number of elements in the list.
-    Space Complexity: O(1).
-    """
-    lst = draw_info.lst
-    for i in range(len(lst)):
-        # Highlight the current bar being compared
-        draw_list(draw_info, {i: draw_info.RED}, True)
-        yield True
-        if lst[i] == target:
-            # Highlight the found element in green
-            draw_list(draw_info, {i: draw_info.GREEN}, True)
-            yield True
-            break
-    return lst
-def main():
+    n = len(lst)
+    surface = draw_info.column_surface
+    width, height = surface.get_size()
+    scale = draw_info.block_height
+    # First element of each column (strictly increasing because n > width)
+    if np is not None:
+        values = np.fromiter(lst, dtype=np.float64, count=n)
+        starts = np.arange(width) * n // width
+        lows = np.minimum.reduceat(values, starts)
+        highs = np.maximum.reduceat(values, starts)
+        means = np.add.reduceat(values, starts) / np.diff(np.append(starts, n))
+        # Shade level of every pixel: 0 background, 1 below max, 2 below mean, 3 below min
+        rows = np.arange(height, dtype=np.float32)[None, :]
+        levels = (rows >= (height - (highs - draw_info.min_val) * scale)[:, None]).view(np.uint8)
+        levels += rows >= (height - (means - draw_info.min_val) * scale)[:, None]
+        levels += rows >= (height - (lows - draw_info.min_val) * scale)[:, None]
+        palette = np.array([surface.map_rgb(c) for c in (draw_info.BACKGROUND_COLOR, *reversed(draw_info.GRADIENTS))],
+                           dtype=np.uint32)
+        pixels = palette[levels]
+        for i, color in color_positions.items():
+            column = i * width // n
+            pixels[column, levels[column] > 0] = surface.map_rgb(color)
+        pygame.surfarray.blit_array(surface, pixels)
+    else:
+        surface.fill(draw_info.BACKGROUND_COLOR)
+        highlighted = {i * width // n: color for i, color in color_positions.items()}
+        for column in range(width):
+            group = lst[column * n // width:(column + 1) * n // width]
+            tops = [height - (v - draw_info.min_val) * scale for v in (max(group), sum(group) / len(group), min(group))]
+            if column in highlighted:
+                pygame.draw.line(surface, highlighted[column], (column, tops[0]), (column, height))
+                continue
+            for top, color in zip(tops, reversed(draw_info.GRADIENTS)):
+                pygame.draw.line(surface, color, (column, top), (column, height))
+    draw_info.window.blit(surface, (draw_info.start_x, draw_info.TOP_PAD))
+    if clear_bg:
+        update_display(draw_info, [pygame.Rect((draw_info.start_x, draw_info.TOP_PAD), (width, height))])
+# Function to draw a single bar and the value above it
+def draw_bar(draw_info, i, val, color):
+    """Draws bar i with its value label (labels come from the glyph cache)."""
+    x = draw_info.start_x + i * draw_info.block_width
+    y = draw_info.height - (val - draw_info.min_val) * draw_info.block_height
+    pygame.draw.rect(draw_info.window, color, (x, y, draw_info.block_width, draw_info.height - y))
+    # Draw the value on top of the bar
+    value_surface = draw_info.glyph(val)
+    value_x = x + (draw_info.block_width // 2) - (value_surface.get_width() // 2)  # Center the text
+    value_y = y - value_surface.get_height() - 5  # Position it above the bar
+    # Only draw the value if it is above the top of the window
+    if value_y >= draw_info.TOP_PAD:
+        draw_info.window.blit(value_surface, (value_x, value_y))
+# Function to generate a random list of integers within a specified range
+def generate_starting_list(n, min_val, max_val):
+    """Generates a list of random integers within specified range (in one vectorized call with NumPy)."""
+    if np is not None:
+        return np.random.default_rng().integers(min_val, max_val, n, endpoint=True).tolist()
+    return [random.randint(min_val, max_val) for _ in range(n)]  # Generate list of random integers
+# Function to pick the highlight colors for the bars a trace event touched
+def event_colors(draw_info, event):
+    """Returns {position: color} for the positions of a trace event."""
+    op, a, b = event
+    if op in (COMPARE, SWAP):
+        return {a: draw_info.BLUE, b: draw_info.RED}
+    if op == INDEX:
+        return {a: draw_info.RED}
+    if op == FOUND:
+        return {a: draw_info.GREEN}
+    return {a: draw_info.BLUE}
+# Function to render one trace event by highlighting the bars it touched
+def draw_event(draw_info, event):
+    """Draws the list with the positions of a trace event highlighted."""
+    draw_list(draw_info, event_colors(draw_info, event), True)
+# Class to advance an algorithm generator in batches that fit the frame-time budget
+class StepScheduler:
+    # Visible steps per frame for each speed setting (1 = one step per frame)
+    SPEEDS = [1, 2, 5, 10, 25, 50, 100, 250, 1000, 10000, 100000]
+    # Time per frame that may be spent running the algorithm, leaving the rest for drawing
+    FRAME_BUDGET = 0.012
+    def __init__(self):
+        self.speed_index = 0
+        self.generator = None
+        self.paused = False
+        self.single_step = False
+        self.algorithm_time = 0.0  # Time spent inside the algorithm only
+        self.wall_tick = 0.0
+        self.wall_time = 0.0  # Time since the run started, including drawing but not pauses
+        self.last_event = None  # Last step drawn, kept highlighted while paused
+    @property
+    def speed(self):
+        return self.SPEEDS[self.speed_index]
+    def change_speed(self, delta):
+        """Moves to the next faster (delta=1) or slower (delta=-1) speed setting."""
+        self.speed_index = max(0, min(len(self.SPEEDS) - 1, self.speed_index + delta))
+    def start(self, generator):
+        """Starts a new run of an algorithm generator."""
+        self.generator = generator
+        self.paused = False
+        self.single_step = False
+        self.algorithm_time = 0.0
+        self.wall_tick = time.perf_counter()
+        self.wall_time = 0.0
+        self.last_event = None
+    def toggle_pause(self):
+        self.paused = not self.paused
+    def request_step(self):
+        """While paused, runs exactly one visible step on the next frame."""
+        self.single_step = True
+    def run_frame(self, draw_info):
+        """Advances the algorithm by up to `speed` visible steps, stopping early when the frame
+        budget is used up, then draws the last step. Comparisons are run but not counted or drawn.
+        Returns True when the algorithm has finished."""
+        now = time.perf_counter()
+        if not self.paused:
+            self.wall_time += now - self.wall_tick  # The clock stops while paused, so idle frames stay unchanged
+        self.wall_tick = now
+        if self.paused and not self.single_step:
+            return False
+        steps = 1 if self.paused else self.speed
+        self.single_step = False
+        deadline = time.perf_counter() + self.FRAME_BUDGET
+        last_event = None
+        finished = False
+        clock = time.perf_counter
+        while steps > 0:
+            before = clock()
+            try:
+                event = next(self.generator)
+            except StopIteration:
+                finished = True
+                break
+            after = clock()
+            self.algorithm_time += after - before
+            if event[0] != COMPARE:
+                last_event = event
+                steps -= 1
+            if after >= deadline:
+                break
+        if last_event is not None:
+            self.last_event = last_event
+            draw_event(draw_info, last_event)
+        return finished
+# One quarter of the window in race mode, showing one algorithm
+class Pane(DrawInformation):
+    # Smaller padding than the full window; the top area holds the pane's counters
+    SIDE_PAD = 40
+    TOP_PAD = 60
+    def __init__(self, window, rect, lst, name, algorithm):
+        super().__init__(rect.width, rect.height, lst, window.subsurface(rect))
+        self.name = name
+        self.generator = algorithm(self.lst)
+        self.counts = dict.fromkeys(OP_NAMES, 0)  # Operations performed so far, by kind
+        self.operations = 0
+        self.finished = False
+    def draw_header(self):
+        """Draws the algorithm name and its live operation counters above the bars."""
+        header = pygame.Rect(0, 0, self.width, self.TOP_PAD)
+        self.window.fill(self.BACKGROUND_COLOR, header)
+        pygame.draw.rect(self.window, self.BLACK, self.window.get_rect(), 1)  # Pane border
+        state = "done" if self.finished else "running"
+        title = self.render_text("title", self.FONT, f"{self.name} - {state} after {self.operations} operations")
+        counters = self.render_text("counters", self.FONT, f"Comparisons: {self.counts['compare']} | "
+                                    f"Swaps: {self.counts['swap']} | Writes: {self.counts['write']}")
+        self.window.blit(title, (10, 10))
+        self.window.blit(counters, (10, 32))
+        update_display(self, [header])
+# Class to run several algorithms side by side on copies of the same list
+class Race:
+    ALGORITHMS = [
+        ("Bubble Sort", bubble_sort), ("Merge Sort", merge_sort),
+        ("Quick Sort", quick_sort), ("Radix Sort", radix_sort)
+    ]
+    # Operations each pane runs per turn; small enough that the budget is checked often
+    SLICE = 64
+    def __init__(self, window, lst):
+        width, height = window.get_size()
+        self.panes = []
+        for k, (name, algorithm) in enumerate(self.ALGORITHMS):
+            rect = pygame.Rect((k % 2) * width // 2, (k // 2) * height // 2, width // 2, height // 2)
+            self.panes.append(Pane(window, rect, list(lst), name, algorithm))
+    @property
+    def finished(self):
+        return all(pane.finished for pane in self.panes)
+    def draw(self):
+        """Draws every pane from scratch."""
+        for pane in self.panes:
+            pane.window.fill(pane.BACKGROUND_COLOR)
+            draw_list(pane)
+            pane.draw_header()
+        pygame.display.update()
+    def run_frame(self, operations):
+        """Advances every unfinished algorithm by the same number of operations (events of any
+        kind, comparisons included), so the panes progress at a fair, comparable pace.
+        The panes take turns in slices of at most SLICE operations; when the frame budget runs
+        out between turns, the frame's quota is cut short for all of them alike. Drawing comes
+        after all stepping and is not counted against the budget."""
+        deadline = time.perf_counter() + StepScheduler.FRAME_BUDGET
+        running = [pane for pane in self.panes if not pane.finished]
+        last_events = dict.fromkeys(running)
+        active = running
+        done = 0
+        while done < operations and active and time.perf_counter() < deadline:
+            step = min(self.SLICE, operations - done)
+            for pane in active:
+                for _ in range(step):
+                    try:
+                        event = next(pane.generator)
+                    except StopIteration:
+                        pane.finished = True
+                        break
+                    pane.operations += 1
+                    pane.counts[OP_NAMES[event[0]]] += 1
+                    if event[0] != COMPARE:
+                        last_events[pane] = event
+            done += step
+            active = [pane for pane in active if not pane.finished]
+        for pane in running:
+            if pane.finished:
+                draw_list(pane, {}, True)  # Show the sorted list without highlights
+            elif last_events[pane] is not None:
+                draw_event(pane, last_events[pane])
+            pane.draw_header()
+# Event type for commands from a text prompt or the command channel (attributes: name, value)
+COMMAND = pygame.USEREVENT
+# Class for in-window text entry, so no blocking input() call stalls the event loop
+class TextPrompt:
+    def __init__(self, name, label, minimum=None):
+        self.name = name  # Name of the COMMAND event sent with the entered value
+        self.label = label
+        self.minimum = minimum
+        self.text = ""
+        self.error = ""
+        self.closed = False
+    def handle_key(self, event):
+        """Edits the text with a key press. Enter returns the entered integer (or shows an error
+        and keeps the prompt open), Escape closes the prompt. Returns None otherwise."""
+        if event.key == pygame.K_ESCAPE:
+            self.closed = True
+        elif event.key == pygame.K_BACKSPACE:
+            self.text = self.text[:-1]
+        elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+            try:
+                value = int(self.text)
+            except ValueError:
+                self.error = "Please enter an integer"
+                return None
+            if self.minimum is not None and value < self.minimum:
+                self.error = f"Please enter at least {self.minimum}"
+                return None
+            self.closed = True
+            return value
+        elif event.unicode and (event.unicode.isdigit() or event.unicode == "-" and not self.text):
+            self.text += event.unicode
+            self.error = ""
+        return None
+    def as_command(self, value):
+        return pygame.event.Event(COMMAND, name=self.name, value=value)
+# Function to draw an open text prompt over the window
+def draw_prompt(draw_info, prompt):
+    """Draws the prompt box in the middle of the window and updates only its rectangle."""
+    text = f"{prompt.label}: {prompt.text}_"
+    hint = prompt.error or "Enter - OK | Esc - Cancel"
+    label = draw_info.render_text("prompt", draw_info.FONT, text)
+    hint_label = draw_info.render_text("prompt_hint", draw_info.FONT, hint)
+    rect = pygame.Rect(0, 0, max(300, label.get_width(), hint_label.get_width()) + 40, 70)
+    rect.center = (draw_info.width // 2, draw_info.height // 2)
+    pygame.draw.rect(draw_info.window, draw_info.BLACK, rect, border_radius=10)  # Border
+    pygame.draw.rect(draw_info.window, draw_info.WHITE, rect.inflate(-4, -4), border_radius=10)  # Inner background
+    draw_info.window.blit(label, (rect.x + 20, rect.y + 14))
+    draw_info.window.blit(hint_label, (rect.x + 20, rect.y + 40))
+    update_display(draw_info, [rect])
+# Class to receive commands for a running visualizer from stdin or a local socket
+class CommandChannel:
+    """Reads commands on background threads and queues them; the main loop drains the queue
+    once per frame without waiting, so rendering never stalls on input.
+    One command per line:
+        bubble | merge | quick | radix | linear     select an algorithm
+        start | reset | race | pause | step | faster | slower | quit
+        count N        new random list of N elements
+        data V1 V2 ... new list with these values
+        target T       search for T (with Linear Search selected)"""
+    # Commands that act exactly like a key press
+    KEYS = {
+        "bubble": pygame.K_b, "merge": pygame.K_m, "quick": pygame.K_q, "radix": pygame.K_d,
+        "linear": pygame.K_l, "start": pygame.K_SPACE, "reset": pygame.K_r, "race": pygame.K_a,
+        "pause": pygame.K_p, "step": pygame.K_n, "faster": pygame.K_UP, "slower": pygame.K_DOWN,
+    }
+    def __init__(self, stdin=False, port=None):
+        self.commands = queue.Queue()
+        self.server = None
+        if stdin:
+            threading.Thread(target=self.read_lines, args=(sys.stdin,), daemon=True).start()
+        if port is not None:
+            channel = self
+            class Handler(socketserver.StreamRequestHandler):
+                def handle(self):
+                    for line in self.rfile:
+                        reply = channel.submit(line.decode(errors="replace"))
+                        self.wfile.write(f"{reply}\n".encode())
+            # Local connections only: anyone who can connect can drive the visualizer
+            self.server = socketserver.ThreadingTCPServer(("127.0.0.1", port), Handler)
+            self.server.daemon_threads = True
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    @staticmethod
+    def parse(line):
+        """Parses a command line into (name, value). Raises ValueError for an unknown or malformed command."""
+        words = line.split()
+        if not words:
+            raise ValueError("empty command")
+        name, args = words[0].lower(), words[1:]
+        if name in CommandChannel.KEYS or name == "quit":
+            if args:
+                raise ValueError(f"{name} takes no arguments")
+            return name, None
+        if name in ("count", "target"):
+            if len(args) != 1:
+                raise ValueError(f"{name} takes one integer")
+            value = int(args[0])
+            if name == "count" and value < 1:
+                raise ValueError("count must be at least 1")
+            return name, value
+        if name == "data":
+            if not args:
+                raise ValueError("data needs at least one value")
+            return name, [int(word) for word in args]
+        raise ValueError(f"unknown command {name!r}")
+    def submit(self, line):
+        """Queues one command line; returns the reply for the sender ("ok" or the error)."""
+        try:
+            self.commands.put(self.parse(line))
+        except ValueError as error:
+            return f"error: {error}"
+        return "ok"
+    def read_lines(self, stream):
+        for line in stream:
+            reply = self.submit(line)
+            if reply != "ok":
+                print(reply, file=sys.stderr)
+    def poll(self):
+        """Returns the queued commands as pygame events, without blocking."""
+        events = []
+        while True:
+            try:
+                name, value = self.commands.get_nowait()
+            except queue.Empty:
+                return events
+            if name == "quit":
+                events.append(pygame.event.Event(pygame.QUIT))
+            elif name in self.KEYS:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=self.KEYS[name], unicode="", mod=0, channel=True))
+            else:
+                events.append(pygame.event.Event(COMMAND, name=name, value=value))
+    def close(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Visualize the sorting algorithms.")
+    parser.add_argument("--n", type=int, help="number of elements (asked for in the window if omitted)")
+    parser.add_argument("--stdin", action="store_true", help="read commands from standard input (see CommandChannel)")
+    parser.add_argument("--listen", type=int, metavar="PORT", help="accept commands on this local TCP port")
+    return parser.parse_args(argv)
+def main(argv=None):
+    args = parse_args(argv)
     run = True
     clock = pygame.time.Clock()
-    # Prompt the user to enter the number of elements for the list
-    try:
-        n = int(input("Enter the number of elements to sort: "))
-    except ValueError:
-        print("Invalid input. Defaulting to 200 elements.")
-        n = 200  # Default to 200 elements if input is invalid
+    channel = CommandChannel(args.stdin, args.listen)
+    n = args.n or 200  # Shown until the number of elements is entered in the window
+    # Ask for the number of elements in the window instead of blocking on the terminal
+    prompt = None if args.n else TextPrompt("count", "Number of elements to sort", minimum=1)
     min_val = 1
     max_val = 100
     # Generate the initial random list of numbers
@@ -281,94 +576,116 @@ def main():
     sorting_completed = False
     sorting_algorithm = None
     sorting_algo_name = ""
-    sorting_algorithm_generator = None
-    start_time = -1
-    final_time = 0  # Store the final elapsed time
+    scheduler = StepScheduler()  # Runs the selected algorithm a batch of steps per frame
+    race = None  # Race mode: all four sorts side by side
+    final_time = 0  # Store the final algorithm time
     target = None  # Target value for linear search
     # Main loop for the Pygame window
     while run:
         clock.tick(60)  # Set the frame rate to 60 frames per second
-        if sorting:
-            try:
-                next(sorting_algorithm_generator)
-            except StopIteration:
+        status = f"Speed x{scheduler.speed} | Wall {scheduler.wall_time:.2f}s"
+        if race is not None:
+            if not race.finished and not scheduler.paused:
+                race.run_frame(scheduler.speed)
+        elif sorting or searching:
+            stepping = scheduler.paused and scheduler.single_step
+            if scheduler.run_frame(draw_info):
                 sorting = False
-                sorting_completed = True  # Mark sorting as completed
-                final_time = time.time() - start_time  # Store the final time
-        elif searching:
-            try:
-                next(sorting_algorithm_generator)
-            except StopIteration:
                 searching = False
-                sorting_completed = True
-                final_time = time.time() - start_time
+                sorting_completed = True  # Mark sorting as completed
+                final_time = scheduler.algorithm_time  # Store the final time
+            elif scheduler.paused and not stepping:
+                # Full redraws keep the last step highlighted; a step just drawn shows until the next frame
+                colors = event_colors(draw_info, scheduler.last_event) if scheduler.last_event else {}
+                draw(draw_info, sorting_algo_name, scheduler.algorithm_time, False, status + " | PAUSED", colors)
         else:
-            # Calculate the elapsed time during sorting/searching
-            time_elapsed = final_time if sorting_completed else (time.time() - start_time if start_time != -1 else 0)
-            draw(draw_info, sorting_algo_name, time_elapsed, sorting_completed)
-        # Event handling for user input
-        for event in pygame.event.get():
+            # Show the algorithm time of the finished run
+            time_elapsed = final_time if sorting_completed else 0
+            draw(draw_info, sorting_algo_name, time_elapsed, sorting_completed, status)
+        if prompt is not None:
+            draw_prompt(draw_info, prompt)
+        # Event handling for user input and queued commands
+        for event in pygame.event.get() + channel.poll():
             if event.type == pygame.QUIT:
                 run = False  # Quit the program if the window is closed
-            if event.type != pygame.KEYDOWN:
+            if prompt is not None and event.type == pygame.KEYDOWN and not getattr(event, "channel", False):
+                # Keys typed in the window go to the open prompt; its value is handled like a command
+                value = prompt.handle_key(event)
+                if prompt.closed:
+                    draw_info.frame_key = None  # Redraw over the prompt box
+                    if value is not None:
+                        event = prompt.as_command(value)
+                    prompt = None
+                if event.type == pygame.KEYDOWN:
+                    continue
+            if event.type == COMMAND and event.name == "target":
+                if sorting or searching or race is not None or sorting_algo_name != "Linear Search":
+                    continue  # Linear Search not selected, or busy
+                target = event.value
+                searching = True
+                sorting_completed = False
+                scheduler.start(sorting_algorithm(draw_info.lst, target))
                 continue
-            if event.key == pygame.K_r:  # Reset the sorting process
-                lst = generate_starting_list(n, min_val, max_val)
+            new_list = event.type == COMMAND or event.type == pygame.KEYDOWN and event.key == pygame.K_r
+            if new_list:  # Reset the sorting process, with a new list
+                if event.type == COMMAND and event.name == "data":
+                    lst = event.value
+                    n = len(lst)
+                else:
+                    if event.type == COMMAND:
+                        n = event.value
+                    lst = generate_starting_list(n, min_val, max_val)
+                race = None
+                scheduler.paused = False
                 draw_info.set_list(lst)
                 sorting = False
                 searching = False
                 sorting_completed = False  # Reset the completion flag
-                start_time = -1
                 sorting_algo_name = ""
                 final_time = 0  # Reset the final time
                 target = None
-            elif event.key == pygame.K_SPACE and not sorting and not searching:
+            elif event.type != pygame.KEYDOWN:
+                continue
+            elif event.key == pygame.K_a and not sorting and not searching and race is None:
+                race = Race(draw_info.window, draw_info.lst)  # Each pane sorts its own copy
+                race.draw()
+            elif event.key == pygame.K_p and (sorting or searching or race is not None):
+                scheduler.toggle_pause()
+            elif event.key == pygame.K_n and scheduler.paused and (sorting or searching):
+                scheduler.request_step()
+            elif event.key == pygame.K_UP:
+                scheduler.change_speed(1)
+            elif event.key == pygame.K_DOWN:
+                scheduler.change_speed(-1)
+            elif event.key == pygame.K_SPACE and not sorting and not searching and race is None:
                 if sorting_algorithm is None:
                     continue  # No sorting algorithm selected
                 sorting = True
                 sorting_completed = False
-                start_time = time.time()  # Start the timer
-                # Initialize the appropriate sorting algorithm
-                if sorting_algo_name == "Merge Sort":
-                    sorting_algorithm_generator = sorting_algorithm(draw_info, draw_info.lst, 0, len(draw_info.lst) - 1)
-                elif sorting_algo_name == "Quick Sort":
-                    sorting_algorithm_generator = sorting_algorithm(draw_info, draw_info.lst, 0, len(draw_info.lst) - 1)
-                else:
-                    sorting_algorithm_generator = sorting_algorithm(draw_info)
-            elif event.key == pygame.K_s and not sorting and not searching:
+                # Initialize the selected sorting algorithm on the displayed list
+                scheduler.start(sorting_algorithm(draw_info.lst))
+            elif event.key == pygame.K_s and not sorting and not searching and race is None:
                 if sorting_algorithm is None or sorting_algo_name != "Linear Search":
                     continue  # Linear Search not selected
-                target_input = input("Enter the target value to search for: ")
-                try:
-                    target = int(target_input)
-                except ValueError:
-                    print("Invalid input. Please enter an integer.")
-                    continue
-                searching = True
-                sorting_completed = False
-                start_time = time.time()  # Start the timer
-                sorting_algorithm_generator = sorting_algorithm(draw_info, target)
+                # The search starts when the prompt sends the target
+                prompt = TextPrompt("target", "Target value to search for")
             # Set the sorting algorithm based on user input
             elif event.key == pygame.K_b and not sorting and not searching:
                 sorting_algorithm = bubble_sort
                 sorting_algo_name = "Bubble Sort"
-                start_time = -1
             elif event.key == pygame.K_m and not sorting and not searching:
                 sorting_algorithm = merge_sort
                 sorting_algo_name = "Merge Sort"
-                start_time = -1
             elif event.key == pygame.K_q and not sorting and not searching:
                 sorting_algorithm = quick_sort
                 sorting_algo_name = "Quick Sort"
-                start_time = -1
             elif event.key == pygame.K_d and not sorting and not searching:
                 sorting_algorithm = radix_sort
                 sorting_algo_name = "Radix Sort"
-                start_time = -1
             elif event.key == pygame.K_l and not sorting and not searching:
                 sorting_algorithm = linear_search
                 sorting_algo_name = "Linear Search"
-                start_time = -1
+    channel.close()
     pygame.quit()  # Quit Pygame when the program ends
 # Run the main function
 if __name__ == "__main__":
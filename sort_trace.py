@@ -0,0 +1,412 @@
+import argparse
+import random
+import struct
+import sys
+import tracemalloc
+from array import array
+
+# Step traces for the sorting visualization
+# The algorithms below sort a plain list and yield one compact event per operation instead
+# of drawing. Events can be rendered live (group3visual.py) or recorded headlessly into a
+# TraceBuffer, saved to disk and replayed or scrubbed later.
+#
+# Usage:
+#   python sort_trace.py --algorithm merge --n 100000 --output merge.trace
+
+# Event operation codes. Every event is a triple (op, a, b):
+COMPARE = 0  # lst[a] was compared with lst[b]
+SWAP = 1     # lst[a] and lst[b] were swapped
+WRITE = 2    # lst[a] was set to the value b
+INDEX = 3    # position a was visited (b unused)
+FOUND = 4    # the search target was found at position a (b unused)
+
+OP_NAMES = ["compare", "swap", "write", "index", "found"]
+
+
+# Sorting Algorithms
+def bubble_sort(lst):
+    """
+    Bubble Sort Algorithm Trace:
+    Time Complexity: O(n^2) in the worst case, O(n) in the best case (already sorted array).
+    Space Complexity: O(1) as it sorts in place.
+    """
+    n = len(lst)
+    # Bubble sort process with two loops
+    for i in range(n - 1):
+        for j in range(n - 1 - i):
+            yield COMPARE, j, j + 1
+            # Swap adjacent elements if they are in the wrong order
+            if lst[j] > lst[j + 1]:
+                lst[j], lst[j + 1] = lst[j + 1], lst[j]
+                yield SWAP, j, j + 1
+
+
+def merge_sort(lst, l=0, r=None):
+    """
+    Merge Sort Algorithm Trace:
+    Time Complexity: O(n log n) in all cases.
+    Space Complexity: O(n) due to the use of auxiliary arrays.
+    """
+    if r is None:
+        r = len(lst) - 1
+    if l >= r:
+        return
+    # Divide the array into two halves recursively
+    mid = (l + r) // 2
+    yield from merge_sort(lst, l, mid)
+    yield from merge_sort(lst, mid + 1, r)
+    yield from merge(lst, l, mid, r)
+
+
+def merge(lst, l, mid, r):
+    """
+    Merge step for Merge Sort: Merges two sorted halves.
+    Compare events refer to the positions the two elements occupied before the merge.
+    """
+    left = lst[l:mid + 1]
+    right = lst[mid + 1:r + 1]
+    i = j = 0
+    k = l
+    # Merge the two halves by comparing elements
+    while i < len(left) and j < len(right):
+        yield COMPARE, l + i, mid + 1 + j
+        if left[i] <= right[j]:
+            lst[k] = left[i]
+            i += 1
+        else:
+            lst[k] = right[j]
+            j += 1
+        yield WRITE, k, lst[k]
+        k += 1
+    # Copy any remaining elements from left
+    while i < len(left):
+        lst[k] = left[i]
+        yield WRITE, k, lst[k]
+        i += 1
+        k += 1
+    # Copy any remaining elements from right
+    while j < len(right):
+        lst[k] = right[j]
+        yield WRITE, k, lst[k]
+        j += 1
+        k += 1
+
+
+def quick_sort(lst, low=0, high=None):
+    """
+    Quick Sort Algorithm Trace:
+    - Partitions around the last element into <, == and > parts, so runs of equal values are
+      finished in one pass.
+    - Ranges still to sort are kept on an explicit stack, smaller range first, so the
+      generator nesting stays constant however unbalanced the partitions are.
+    Time Complexity: O(n log n) on average, O(n^2) in the worst case (already sorted array).
+    Space Complexity: O(log n) for the stack of ranges.
+    """
+    if high is None:
+        high = len(lst) - 1
+    ranges = [(low, high)]
+    while ranges:
+        low, high = ranges.pop()
+        if low >= high:
+            continue
+        # Partition the range and get the bounds of the elements equal to the pivot
+        lt, gt = yield from partition(lst, low, high)
+        # Push the larger side first so the smaller one is sorted next
+        sides = sorted([(low, lt - 1), (gt + 1, high)], key=lambda side: side[1] - side[0], reverse=True)
+        ranges.extend(sides)
+
+
+def partition(lst, low, high):
+    """
+    Split the array into parts based on a pivot for Quick Sort.
+    The pivot lst[high] stays in place while the rest is split into elements less than,
+    equal to and greater than it; it is then swapped to the end of the equal part.
+    Returns (lt, gt): lst[lt:gt + 1] all equal the pivot.
+    """
+    pivot = lst[high]
+    lt = i = low  # lst[low:lt] < pivot, lst[lt:i] == pivot
+    gt = high     # lst[gt:high] > pivot
+    while i < gt:
+        yield COMPARE, i, high
+        if lst[i] < pivot:
+            lst[lt], lst[i] = lst[i], lst[lt]
+            yield SWAP, lt, i
+            lt += 1
+            i += 1
+        elif lst[i] > pivot:
+            gt -= 1
+            lst[i], lst[gt] = lst[gt], lst[i]
+            yield SWAP, i, gt
+        else:
+            i += 1
+    # Place the pivot element after the other elements equal to it
+    lst[gt], lst[high] = lst[high], lst[gt]
+    yield SWAP, gt, high
+    return lt, gt
+
+
+def counting_sort(lst, exp, low=0):
+    """
+    Helper function for Radix Sort to perform Counting Sort based on significant digits.
+    Digits are taken from lst[i] - low, so negative values sort correctly when low is the minimum.
+    Time Complexity: O(n), where n is the number of elements.
+    Space Complexity: O(n + k), where k is the number of digits (range of the count).
+    """
+    n = len(lst)
+    output = [0] * n  # Output array to store sorted numbers
+    count = [0] * 10  # Count array to store occurrences of each digit
+    # Count occurrences of digits
+    for i in range(n):
+        index = (lst[i] - low) // exp
+        count[index % 10] += 1
+        yield INDEX, i, 0
+    # Update the count array to contain positions of digits
+    for i in range(1, 10):
+        count[i] += count[i - 1]
+    # Build the output array by placing elements in correct positions
+    i = n - 1
+    while i >= 0:
+        index = (lst[i] - low) // exp
+        output[count[index % 10] - 1] = lst[i]
+        count[index % 10] -= 1
+        yield INDEX, i, 0
+        i -= 1
+    # Copy the output array back to the original list
+    for i in range(n):
+        lst[i] = output[i]
+        yield WRITE, i, lst[i]
+
+
+def radix_sort(lst):
+    """
+    Radix Sort Algorithm Trace:
+    Time Complexity: O(d * (n + k)), where d is the number of digits, n is the number of elements, and k is the base.
+    Space Complexity: O(n + k) due to auxiliary storage.
+    Negative numbers are handled by sorting on the offset from the minimum.
+    """
+    if not lst:
+        return
+    low = min(lst)
+    max1 = max(lst) - low  # Find the largest offset to determine the number of digits
+    exp = 1
+    # Perform counting sort for every digit (starting from least significant digit)
+    while max1 // exp > 0:
+        yield from counting_sort(lst, exp, low)
+        exp *= 10
+
+
+def linear_search(lst, target):
+    """
+    Linear Search Algorithm Trace:
+    Time Complexity: O(n), where n is the number of elements in the list.
+    Space Complexity: O(1).
+    """
+    for i in range(len(lst)):
+        yield INDEX, i, 0
+        if lst[i] == target:
+            yield FOUND, i, 0
+            break
+
+
+# Algorithms that can be recorded, by the name used on the command line
+ALGORITHMS = {
+    "bubble": bubble_sort,
+    "merge": merge_sort,
+    "quick": quick_sort,
+    "radix": radix_sort,
+    "linear": linear_search,
+}
+
+
+def apply_event(lst, event):
+    """Applies the effect of one event (swap or write) to lst; other events change nothing."""
+    op, a, b = event
+    if op == SWAP:
+        lst[a], lst[b] = lst[b], lst[a]
+    elif op == WRITE:
+        lst[a] = b
+
+
+class TraceBuffer:
+    """
+    Compact, array-backed storage for a sequence of events.
+    - Events are stored flat in one array('q') (three 8-byte ints per event, wide enough for
+      any 64-bit element value in WRITE events) rather than as a list of tuples, so millions
+      of steps fit in a few tens of megabytes.
+    - Keeps the initial list so the trace can be replayed from the beginning.
+    """
+
+    MAGIC = b"SORTTRC2"  # Version 1 stored 32-bit ints
+    TYPECODE = "q"
+
+    def __init__(self, initial, name=""):
+        self.initial = list(initial)
+        self.name = name
+        self.events = array(self.TYPECODE)
+
+    def __len__(self):
+        return len(self.events) // 3
+
+    def __getitem__(self, k):
+        return tuple(self.events[3 * k:3 * k + 3])
+
+    def __iter__(self):
+        events = self.events
+        for k in range(0, len(events), 3):
+            yield events[k], events[k + 1], events[k + 2]
+
+    def append(self, event):
+        self.events.extend(event)
+
+    def record(self, generator):
+        """Consumes an algorithm generator, appending every event it yields. Returns self."""
+        extend = self.events.extend
+        for event in generator:
+            extend(event)
+        return self
+
+    def counts(self):
+        """Returns the number of events of each kind, keyed by OP_NAMES."""
+        totals = [0] * len(OP_NAMES)
+        for op in self.events[::3]:
+            totals[op] += 1
+        return dict(zip(OP_NAMES, totals))
+
+    def save(self, path):
+        """Writes the trace to path: magic, name, initial list, then the event array."""
+        name = self.name.encode()
+        initial = array(self.TYPECODE, self.initial)
+        with open(path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<qqq", len(name), len(initial), len(self.events)))
+            f.write(name)
+            initial.tofile(f)
+            self.events.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """Reads a trace written by save()."""
+        with open(path, "rb") as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"{path} is not a sort trace")
+            name_len, n, count = struct.unpack("<qqq", f.read(24))
+            name = f.read(name_len).decode()
+            initial = array(cls.TYPECODE)
+            initial.fromfile(f, n)
+            trace = cls(initial, name)
+            trace.events.fromfile(f, count)
+        return trace
+
+
+def record(algorithm, lst, *args):
+    """
+    Runs an algorithm headlessly on a copy of lst and returns its TraceBuffer.
+    algorithm is a name from ALGORITHMS or one of the generator functions.
+    """
+    if isinstance(algorithm, str):
+        algorithm = ALGORITHMS[algorithm]
+    trace = TraceBuffer(lst, algorithm.__name__)
+    return trace.record(algorithm(list(lst), *args))
+
+
+def count_operations(algorithm, lst, *args):
+    """
+    Runs an algorithm headlessly on a copy of lst without storing its events and returns
+    the number of events of each kind (keyed by OP_NAMES) plus:
+    - allocated_bytes: peak memory allocated while it ran (tracemalloc).
+    - max_depth: deepest nesting of generators below the algorithm's own (0 = no recursion),
+      the same measure as Algorithms/instrumentation.py.
+    Nothing is counted unless this is called; live runs in group3visual.py pay nothing.
+    """
+    if isinstance(algorithm, str):
+        algorithm = ALGORITHMS[algorithm]
+    totals = [0] * len(OP_NAMES)
+    depth = max_depth = 0
+
+    def profile(frame, event, arg):
+        nonlocal depth, max_depth
+        if frame.f_code.co_filename != __file__ or frame.f_code is count_operations.__code__:
+            return
+        if event == "call":
+            depth += 1
+            max_depth = max(max_depth, depth)
+        elif event == "return":
+            depth -= 1
+
+    generator = algorithm(list(lst), *args)
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    previous_profiler = sys.getprofile()
+    sys.setprofile(profile)
+    try:
+        for op, _, _ in generator:
+            totals[op] += 1
+    finally:
+        sys.setprofile(previous_profiler)
+        allocated = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+        if started_tracing:
+            tracemalloc.stop()
+    counts = dict(zip(OP_NAMES, totals))
+    counts["allocated_bytes"] = allocated
+    counts["max_depth"] = max(0, max_depth - 1)
+    return counts
+
+
+class Replayer:
+    """
+    Reconstructs the list at any step of a trace.
+    - Snapshots of the list are kept every `checkpoint_interval` steps, so seeking to an
+      arbitrary step replays at most that many events.
+    """
+
+    def __init__(self, trace, checkpoint_interval=10_000):
+        self.trace = trace
+        self.interval = checkpoint_interval
+        self.checkpoints = [list(trace.initial)]
+        self.step = 0
+        self.lst = list(trace.initial)
+
+    def seek(self, step):
+        """Moves to the state after the first `step` events and returns the list."""
+        step = max(0, min(step, len(self.trace)))
+        if step < self.step or step - self.step > self.interval:
+            base = min(step // self.interval, len(self.checkpoints) - 1)
+            self.lst = list(self.checkpoints[base])
+            self.step = base * self.interval
+        while self.step < step:
+            self.advance()
+        return self.lst
+
+    def advance(self):
+        """Applies the next event and returns it (None at the end of the trace)."""
+        if self.step >= len(self.trace):
+            return None
+        event = self.trace[self.step]
+        apply_event(self.lst, event)
+        self.step += 1
+        if self.step % self.interval == 0 and self.step // self.interval == len(self.checkpoints):
+            self.checkpoints.append(list(self.lst))
+        return event
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record a sorting trace headlessly.")
+    parser.add_argument("--algorithm", choices=[name for name in ALGORITHMS if name != "linear"], default="merge")
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--max-val", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    lst = [rng.randint(1, args.max_val) for _ in range(args.n)]
+    trace = record(args.algorithm, lst)
+    trace.save(args.output)
+    print(f"Recorded {len(trace)} events {trace.counts()} to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
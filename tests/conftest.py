@@ -0,0 +1,7 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The Algorithms modules import each other by module name, as when run from that directory
+sys.path.insert(0, os.path.join(ROOT, "Algorithms"))
+sys.path.insert(0, ROOT)
@@ -0,0 +1,69 @@
+import random
+from array import array
+
+import pytest
+
+import external_sort
+from instrumentation import PeakMemory
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(0)
+    return [rng.randint(-2**63, 2**63 - 1) for _ in range(3000)] + [0, -1, 7, 7]
+
+
+def write_text(path, values):
+    # Mixed separators, and numbers that will be split across small read blocks
+    path.write_text("\n".join(" ".join(map(str, values[k:k + 5])) for k in range(0, len(values), 5)))
+
+
+def write_binary(path, values):
+    with open(path, "wb") as f:
+        array("q", values).tofile(f)
+
+
+def read_text(path):
+    return [int(token) for token in path.read_text().split()]
+
+
+@pytest.mark.parametrize("algorithm", list(external_sort.RUN_SORTERS))
+def test_text_round_trip(tmp_path, values, algorithm):
+    write_text(tmp_path / "in.txt", values)
+    count = external_sort.external_sort(tmp_path / "in.txt", tmp_path / "out.txt", 64 << 10, algorithm=algorithm)
+    assert count == len(values)
+    assert read_text(tmp_path / "out.txt") == sorted(values)
+
+
+@pytest.mark.parametrize("algorithm", list(external_sort.RUN_SORTERS))
+def test_binary_round_trip(tmp_path, values, algorithm):
+    write_binary(tmp_path / "in.bin", values)
+    external_sort.external_sort(tmp_path / "in.bin", tmp_path / "out.bin", 64 << 10, "binary", algorithm=algorithm)
+    assert array("q", (tmp_path / "out.bin").read_bytes()).tolist() == sorted(values)
+    external_sort.external_sort(tmp_path / "in.bin", tmp_path / "out.txt", 64 << 10, "binary", "text")
+    assert read_text(tmp_path / "out.txt") == sorted(values)
+
+
+def test_merges_more_runs_than_the_fan_in(tmp_path, values, monkeypatch):
+    monkeypatch.setattr(external_sort, "MAX_FAN_IN", 4)
+    memory = 100 * external_sort.BYTES_PER_ELEMENT["merge_sort"]
+    assert len(values) / external_sort.chunk_elements(memory, "binary") > external_sort.MAX_FAN_IN ** 2
+    write_binary(tmp_path / "in.bin", values)
+    external_sort.external_sort(tmp_path / "in.bin", tmp_path / "out.bin", memory, "binary")
+    assert array("q", (tmp_path / "out.bin").read_bytes()).tolist() == sorted(values)
+
+
+@pytest.mark.parametrize("fmt", ["text", "binary"])
+@pytest.mark.parametrize("algorithm", list(external_sort.RUN_SORTERS))
+def test_stays_within_the_memory_budget(tmp_path, fmt, algorithm):
+    rng = random.Random(1)
+    values = [rng.randint(-2**63, 2**63 - 1) for _ in range(20_000)]
+    if fmt == "text":
+        write_text(tmp_path / "in", values)
+    else:
+        write_binary(tmp_path / "in", values)
+    del values
+    memory = 1 << 20
+    with PeakMemory() as peak:
+        external_sort.external_sort(tmp_path / "in", tmp_path / "out", memory, fmt, algorithm=algorithm)
+    assert peak.peak_bytes <= memory
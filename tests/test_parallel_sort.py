@@ -0,0 +1,80 @@
+import random
+from array import array
+from multiprocessing import shared_memory
+
+import pytest
+
+import parallel_sort
+from parallel_sort import MIN_PARALLEL_SIZE
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(0)
+    return [rng.randint(-10**9, 10**9) for _ in range(MIN_PARALLEL_SIZE + 7)]
+
+
+def test_sorts_ints_and_floats(values):
+    assert parallel_sort.parallel_sort(list(values), workers=2) == sorted(values)
+    floats = [x / 7 for x in values]
+    assert parallel_sort.parallel_sort(list(floats), workers=2) == sorted(floats)
+
+
+def test_rejects_mixed_ints_and_floats(values):
+    with pytest.raises(TypeError):
+        parallel_sort.parallel_sort(values + [0.5], workers=2)
+
+
+def test_tolerates_a_block_rounded_up_to_the_page_size(values, monkeypatch):
+    class PageRoundedMemory(shared_memory.SharedMemory):
+        def __init__(self, name=None, create=False, size=0):
+            super().__init__(name, create, size + 4096 if create else size)
+
+    monkeypatch.setattr(parallel_sort.shared_memory, "SharedMemory", PageRoundedMemory)
+    assert parallel_sort.parallel_sort(list(values), workers=2) == sorted(values)
+
+
+def test_keeps_the_type_of_typed_arrays(values):
+    ints = array("q", values)
+    assert parallel_sort.parallel_sort(ints, workers=2) is ints
+    assert list(ints) == sorted(values)
+    floats = memoryview(array("d", [x / 7 for x in values]))
+    parallel_sort.parallel_sort(floats, workers=2)
+    assert floats.tolist() == sorted(x / 7 for x in values)
+    small = array("i", values[:50])
+    parallel_sort.parallel_sort(small, workers=2)
+    assert list(small) == sorted(values[:50])
+
+
+def test_sorts_an_int64_ndarray(values):
+    np = pytest.importorskip("numpy")
+    arr = np.array(values, dtype=np.int64)
+    parallel_sort.parallel_sort(arr, workers=2)
+    assert arr.dtype == np.int64 and arr.tolist() == sorted(values)
+
+
+def test_rejects_ints_outside_64_bits(values):
+    with pytest.raises(TypeError):
+        parallel_sort.parallel_sort(values + [2**63], workers=2)
+
+
+def _failing_sort(chunk):
+    raise ValueError("chunk rejected")
+
+
+def test_worker_errors_are_reraised_and_the_block_is_unlinked(values, monkeypatch):
+    created = []
+
+    class TrackedMemory(shared_memory.SharedMemory):
+        def __init__(self, name=None, create=False, size=0):
+            super().__init__(name, create, size)
+            if create:
+                created.append(self.name)
+
+    monkeypatch.setattr(parallel_sort.shared_memory, "SharedMemory", TrackedMemory)
+    monkeypatch.setitem(parallel_sort.SORTERS, "failing_sort", _failing_sort)  # Workers are forked
+    with pytest.raises(ValueError, match="chunk rejected"):
+        parallel_sort.parallel_sort(list(values), "failing_sort", workers=2)
+    assert len(created) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=created[0])
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from search import IndexedList, binary_search, exponential_search, interpolation_search, search_many
+
+SEARCHES = [binary_search, interpolation_search, exponential_search]
+
+
+@pytest.fixture
+def repeated():
+    rng = random.Random(0)
+    return sorted(rng.randint(0, 50) for _ in range(500))
+
+
+@pytest.mark.parametrize("search", SEARCHES, ids=lambda f: f.__name__)
+def test_sorted_searches_return_the_first_occurrence(search, repeated):
+    for target in range(-1, 52):
+        expected = repeated.index(target) if target in repeated else -1
+        assert search(repeated, target) == expected
+
+
+@pytest.mark.parametrize("search", SEARCHES, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("arr", [[], [4], [4] * 9, [1, 1, 2, 2, 2, 9, 9]])
+def test_sorted_searches_on_small_and_constant_arrays(search, arr):
+    for target in (0, 1, 2, 4, 9, 10):
+        assert search(arr, target) == (arr.index(target) if target in arr else -1)
+
+
+@pytest.mark.parametrize("mutate", [
+    lambda lst: lst.__setitem__(0, 99),
+    lambda lst: lst.__setitem__(slice(1, 3), [99, 99, 99]),
+    lambda lst: lst.__iadd__([99]),
+    lambda lst: lst.sort(reverse=True),
+    lambda lst: lst.append(99),
+    lambda lst: lst.insert(0, 99),
+    lambda lst: lst.__delitem__(slice(0, 2)),
+    lambda lst: lst.pop(0),
+    lambda lst: lst.reverse(),
+], ids=["setitem", "slice", "iadd", "sort", "append", "insert", "delitem", "pop", "reverse"])
+def test_indexed_list_lookups_follow_mutations(mutate):
+    lst = IndexedList([5, 3, 5, 1, 3])
+    assert lst.find(5) == 0 and lst.positions(3) == [1, 4]
+    mutate(lst)
+    for value in (1, 3, 5, 99):
+        assert lst.find(value) == (lst.index(value) if value in lst else -1)
+        assert lst.positions(value) == [i for i, x in enumerate(lst) if x == value]
+
+
+def test_indexed_list_augmented_assignment_keeps_the_type():
+    lst = IndexedList([1, 2])
+    lst.find(1)
+    lst += [3]
+    assert isinstance(lst, IndexedList) and lst.find(3) == 2
+
+
+@pytest.mark.parametrize("arr", [[7, 3, 7, 1, 3, 9], []])
+def test_search_many_agrees_for_lists_and_indexed_lists(arr):
+    targets = [3, 7, 8, 9, 3, 1]
+    expected = [arr.index(t) if t in arr else -1 for t in targets]
+    assert search_many(arr, targets) == expected
+    assert search_many(IndexedList(arr), targets) == expected
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from sort_trace import ALGORITHMS, Replayer, TraceBuffer, record
+
+
+SORTS = [name for name in ALGORITHMS if name != "linear"]
+
+
+@pytest.mark.parametrize("name", SORTS)
+@pytest.mark.parametrize("low, high", [(1, 100), (-50, 50), (-5, -1)])
+def test_traced_sorts_sort(name, low, high):
+    rng = random.Random(0)
+    lst = [rng.randint(low, high) for _ in range(200)]
+    data = list(lst)
+    for _ in ALGORITHMS[name](data):
+        pass
+    assert data == sorted(lst)
+
+
+@pytest.mark.parametrize("name", SORTS)
+def test_replaying_a_trace_reproduces_the_sort(name):
+    lst = [5, -3, 10, -2, -1, 3, 0]
+    trace = record(name, lst)
+    assert Replayer(trace).seek(len(trace)) == sorted(lst)
+
+
+def test_trace_round_trips_64_bit_values(tmp_path):
+    lst = [3_000_000_000, -5, 2**62, 7]
+    path = tmp_path / "values.trace"
+    record("merge", lst).save(path)
+    trace = TraceBuffer.load(path)
+    assert trace.initial == lst
+    assert Replayer(trace).seek(len(trace)) == sorted(lst)
+
+
+@pytest.mark.parametrize("lst", [list(range(1200)), [7] * 5000, [n % 10 for n in range(20000)]],
+                         ids=["sorted", "equal", "duplicates"])
+def test_quick_sort_stays_below_the_recursion_limit(lst):
+    trace = record("quick", lst)
+    assert Replayer(trace).seek(len(trace)) == sorted(lst)
@@ -0,0 +1,192 @@
+import random
+from array import array
+
+import pytest
+
+import sorting_algorithms
+from sorting_algorithms import (SMALL_SORT_CUTOFFS, bubble_sort, find_runs, introsort, merge_sort, quick_sort,
+                                radix_sort, sort_by_key, np)
+
+
+def natural_merge_sort(arr, **kwargs):
+    return merge_sort(arr, True, **kwargs)
+
+
+def in_place_quick_sort(arr, **kwargs):
+    return quick_sort(arr, True, **kwargs)
+
+
+# Entry points that sort their argument in place (quick_sort's default mode returns a new list)
+IN_PLACE_SORTS = [bubble_sort, merge_sort, natural_merge_sort, in_place_quick_sort, introsort, radix_sort]
+
+CONTAINERS = ["list", "array", "memoryview"] + (["ndarray"] if np is not None else [])
+
+
+def make_container(kind, values):
+    """Returns values in the given container, and the object whose contents are checked afterwards."""
+    if kind == "list":
+        data = list(values)
+        return data, data
+    if kind == "ndarray":
+        data = np.array(values, dtype=np.int64)
+        return data, data
+    data = array("q", values)
+    return (memoryview(data) if kind == "memoryview" else data), data
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(0)
+    return [rng.randint(-50, 50) for _ in range(300)]
+
+
+@pytest.mark.parametrize("kind", CONTAINERS)
+@pytest.mark.parametrize("sort", IN_PLACE_SORTS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("key", [None, abs], ids=["no_key", "abs"])
+def test_key_and_reverse_on_every_container(sort, kind, key, reverse, values):
+    data, contents = make_container(kind, values)
+    sort(data, key=key, reverse=reverse)
+    assert list(contents) == sorted(values, key=key, reverse=reverse)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_out_of_place_quick_sort_leaves_input_unchanged(values, reverse):
+    original = list(values)
+    assert quick_sort(values, key=abs, reverse=reverse) == sorted(original, key=abs, reverse=reverse)
+    assert values == original
+
+
+@pytest.mark.parametrize("sort", IN_PLACE_SORTS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_key_sorts_are_stable(sort, reverse):
+    rng = random.Random(1)
+    records = [(rng.randint(0, 4), i) for i in range(200)]
+    data = list(records)
+    sort(data, key=lambda r: r[0], reverse=reverse)
+    assert data == sorted(records, key=lambda r: r[0], reverse=reverse)
+
+
+def test_key_is_computed_once_per_element(values):
+    calls = []
+
+    def key(x):
+        calls.append(x)
+        return x
+
+    merge_sort(values, key=key)
+    assert len(calls) == len(values)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_radix_sort_composite_keys(reverse):
+    rng = random.Random(2)
+    records = [(rng.randint(-3, 3), rng.randint(0, 1000), i) for i in range(500)]
+    data = list(records)
+    radix_sort(data, key=lambda r: (r[0], r[1]), reverse=reverse)
+    assert data == sorted(records, key=lambda r: (r[0], r[1]), reverse=reverse)
+
+
+def test_radix_sort_rejects_ragged_composite_keys():
+    with pytest.raises(ValueError):
+        radix_sort([(1, 2), (3,)], key=lambda r: r)
+
+
+@pytest.mark.skipif(np is None, reason="requires NumPy")
+def test_radix_sort_key_on_ndarray_does_not_lose_data():
+    data = np.array([5, -3, 2, -8, 1, 7, -4, 0])
+    radix_sort(data, key=abs)
+    assert data.tolist() == [0, 1, 2, -3, -4, 5, 7, -8]
+
+
+@pytest.mark.skipif(np is None, reason="requires NumPy")
+@pytest.mark.parametrize("sort", [merge_sort, quick_sort, radix_sort], ids=lambda f: f.__name__)
+@pytest.mark.parametrize("dtype", ["int64", "int32", "uint16", "float64"])
+def test_array_backends(sort, dtype):
+    rng = np.random.default_rng(3)
+    data = (rng.standard_normal(1000) * 1000).astype(dtype)
+    expected = np.sort(data)
+    assert sort(data) is data
+    assert np.array_equal(data, expected)
+
+
+def test_sort_by_key_out_of_place():
+    data = [3, -1, 2]
+    assert sort_by_key(merge_sort, data, abs, in_place=False) == [-1, 2, 3]
+    assert data == [3, -1, 2]
+
+
+@pytest.fixture
+def cutoffs():
+    saved = dict(SMALL_SORT_CUTOFFS)
+    yield SMALL_SORT_CUTOFFS
+    SMALL_SORT_CUTOFFS.update(saved)
+
+
+@pytest.mark.parametrize("cutoff", [1, 2, 7, 16, 64, 1000])
+@pytest.mark.parametrize("sort", [merge_sort, natural_merge_sort, quick_sort, introsort], ids=lambda f: f.__name__)
+def test_small_sort_cutoffs(sort, cutoff, cutoffs, values):
+    for name in cutoffs:
+        cutoffs[name] = cutoff
+    assert sort(list(values)) == sorted(values)
+
+
+def test_load_cutoffs(tmp_path, cutoffs):
+    path = tmp_path / "cutoffs.json"
+    path.write_text('{"merge_sort": 8}')
+    sorting_algorithms.load_cutoffs(path)
+    assert cutoffs["merge_sort"] == 8
+
+
+def test_find_runs_extends_short_runs():
+    data = [5, 4, 3, 1, 2, 9, 8, 10, 0]
+    bounds = find_runs(data, min_run=4)
+    assert bounds[0] == 0 and bounds[-1] == len(data)
+    for lo, hi in zip(bounds, bounds[1:]):
+        assert data[lo:hi] == sorted(data[lo:hi])
+        assert hi - lo >= 4 or hi == len(data)
+
+
+class Key:
+    """Compares by k only, so the order of equal keys shows whether a sort is stable."""
+
+    def __init__(self, k, tag):
+        self.k = k
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.k < other.k
+
+
+@pytest.mark.parametrize("natural", [False, True])
+def test_galloping_merge_is_stable_on_unbalanced_runs(natural):
+    rng = random.Random(4)
+    # A long sorted run followed by a short one makes one side win many times in a row
+    long_run = sorted((Key(rng.randint(0, 20), i) for i in range(2000)), key=lambda x: x.k)
+    short_run = [Key(rng.randint(0, 20), 2000 + i) for i in range(9)]
+    data = long_run + short_run
+    merge_sort(data, natural)
+    expected = sorted(long_run + short_run, key=lambda x: x.k)
+    assert [(x.k, x.tag) for x in data] == [(x.k, x.tag) for x in expected]
+
+
+@pytest.mark.parametrize("natural", [False, True])
+def test_merge_sort_on_presorted_input(natural):
+    data = list(range(1000)) + list(range(500))
+    assert merge_sort(list(data), natural) == sorted(data)
+
+
+@pytest.mark.parametrize("text", ["99999999999999999999", "1 -99999999999999999999 2"])
+def test_parse_array_rejects_out_of_range_values(text):
+    with pytest.raises(ValueError):
+        sorting_algorithms.parse_array(text)
+
+
+@pytest.mark.parametrize("text", ["", "\n", b"  \t\n"])
+def test_parse_array_of_blank_text_is_empty(text):
+    assert sorting_algorithms.parse_array(text).tolist() == []
+
+
+def test_parse_array_keeps_the_int64_limits():
+    text = "9223372036854775807 -9223372036854775808 5"
+    assert sorting_algorithms.parse_array(text).tolist() == [2**63 - 1, -2**63, 5]